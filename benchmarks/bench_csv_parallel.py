@@ -0,0 +1,37 @@
+"""Compares read.from_csv with read.from_csv_parallel on a generated file.
+
+Usage:
+    python -m benchmarks.bench_csv_parallel [rows] [workers]
+"""
+
+import csv
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+from src.umpyutl import read
+
+
+def main(rows: int = 1_000_000, workers: int = 0) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filepath = Path(tmp_dir).joinpath("large.csv")
+        with open(filepath, "w", encoding="utf-8", newline="") as file_obj:
+            writer = csv.writer(file_obj)
+            writer.writerow(["id", "name", "note", "value"])
+            for row in range(rows):
+                writer.writerow([row, f"name {row}", f'say "hi"\nline {row % 7}', row * 0.5])
+
+        print(f"{rows:,} rows ({filepath.stat().st_size:,} bytes)")
+        for label, func in (
+            ("from_csv", lambda: read.from_csv(filepath)),
+            ("parallel", lambda: read.from_csv_parallel(filepath, workers or None)),
+            ("parallel len", lambda: read.from_csv_parallel(filepath, workers or None, map_fn=len)),
+        ):
+            start = time.perf_counter()
+            func()
+            print(f"{label:<14}{time.perf_counter() - start:>10.3f}s")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,42 @@
+"""Compares the memory footprint and parse time of read.from_csv_to_dicts row types.
+
+Usage:
+    python -m benchmarks.bench_csv_row_types [rows] [columns]
+"""
+
+import csv
+import gc
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from pathlib import Path
+from src.umpyutl import read
+
+
+def main(rows: int = 50_000, columns: int = 20) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filepath = Path(tmp_dir).joinpath("wide.csv")
+        with open(filepath, "w", encoding="utf-8", newline="") as file_obj:
+            writer = csv.writer(file_obj)
+            writer.writerow([f"column_{i}" for i in range(columns)])
+            for row in range(rows):
+                writer.writerow([f"{row % 97}" for _ in range(columns)])
+
+        print(f"{rows:,} rows x {columns} columns ({filepath.stat().st_size:,} bytes)")
+        print(f"{'row_type':<12}{'bytes/row':>12}{'seconds':>10}")
+        for row_type in (None, *read.ROW_TYPES):
+            gc.collect()
+            tracemalloc.start()
+            start = time.perf_counter()
+            data = read.from_csv_to_dicts(filepath, row_type=row_type)
+            elapsed = time.perf_counter() - start
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{row_type or 'dict':<12}{current / len(data):>12,.0f}{elapsed:>10.3f}")
+            del data
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
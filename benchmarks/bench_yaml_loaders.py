@@ -0,0 +1,55 @@
+"""Compares the pure-Python YAML loaders with the libyaml loaders used by read.from_yaml and
+read.iter_yaml_documents.
+
+Usage:
+    python -m benchmarks.bench_yaml_loaders [documents] [items]
+"""
+
+import sys
+import tempfile
+import time
+import yaml
+
+from pathlib import Path
+from src.umpyutl import read
+
+
+def main(documents: int = 20, items: int = 2_000) -> None:
+    if not yaml.__with_libyaml__:
+        print("PyYAML was built without libyaml; from_yaml falls back to the Python loaders.")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        filepath = Path(tmp_dir).joinpath("manifest.yml")
+        manifest = [
+            {
+                "kind": "Deployment",
+                "items": [
+                    {"name": f"item-{i}", "replicas": i % 5, "labels": {"tier": "web"}}
+                    for i in range(items)
+                ],
+            }
+            for _ in range(documents)
+        ]
+        with open(filepath, "w", encoding="utf-8") as file_obj:
+            yaml.safe_dump_all(manifest, file_obj)
+
+        print(f"{documents} documents x {items:,} items ({filepath.stat().st_size:,} bytes)")
+        print(f"{'loader':<24}{'seconds':>10}")
+        for label, func in (
+            ("FullLoader", lambda: list(_load_all(filepath, yaml.FullLoader))),
+            ("SafeLoader", lambda: list(_load_all(filepath, yaml.SafeLoader))),
+            ("iter_yaml_documents", lambda: list(read.iter_yaml_documents(filepath))),
+            ("iter_yaml (safe)", lambda: list(read.iter_yaml_documents(filepath, "safe"))),
+        ):
+            start = time.perf_counter()
+            func()
+            print(f"{label:<24}{time.perf_counter() - start:>10.3f}")
+
+
+def _load_all(filepath: Path, loader: type):
+    with open(filepath, "rb") as file_obj:
+        yield from yaml.load_all(file_obj, Loader=loader)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,209 @@
+import json
+import re
+from typing import Any, Iterable, Iterator, Optional
+
+_STRUCTURAL = re.compile(r'["\[\]{}]')
+_STRING_END = re.compile(r'["\\]')
+_SCALAR_END = re.compile(r"[\s,\]}]")
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+
+class JSONStreamReader:
+    """Incremental reader that yields the values found at a path inside a JSON document
+    delivered as a sequence of text chunks. Only the element being decoded (plus one chunk)
+    is buffered, so memory is bounded by the largest element rather than the document.
+
+    Paths use dotted notation in which "item" denotes every element of an array, e.g.
+    "item" for the elements of a top-level array or "results.item" for the elements of the
+    array stored under the "results" key. An empty path yields the whole document.
+
+    Parameters:
+        chunks (iterable): text chunks of the JSON document
+    """
+
+    def __init__(self, chunks: Iterable[str]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = json.JSONDecoder()
+        self.buf = ""
+        self.pos = 0
+
+    def items(self, path: str = "item") -> Iterator[Any]:
+        """Yields the values at < path >.
+
+        Parameters:
+            path (str): dotted path; "item" matches array elements
+
+        Returns:
+            generator: decoded values in document order
+        """
+
+        yield from self._items(path.split(".") if path else [])
+        if self._peek(eof_ok=True):
+            self._fail("Extra data")
+
+    def _items(self, path: list) -> Iterator[Any]:
+        if not path:
+            yield self._decode()
+            return
+
+        name, rest = path[0], path[1:]
+        char = self._peek()
+        if name == "item" and char == "[":
+            self.pos += 1
+            if self._peek() == "]":
+                self.pos += 1
+                return
+            while True:
+                yield from self._items(rest)
+                char = self._peek()
+                self.pos += 1
+                if char == "]":
+                    return
+                if char != ",":
+                    self._fail("Expecting ',' delimiter")
+        elif name != "item" and char == "{":
+            self.pos += 1
+            if self._peek() == "}":
+                self.pos += 1
+                return
+            while True:
+                if self._peek() != '"':
+                    self._fail("Expecting property name enclosed in double quotes")
+                key = self._decode()
+                if self._peek() != ":":
+                    self._fail("Expecting ':' delimiter")
+                self.pos += 1
+                if key == name:
+                    yield from self._items(rest)
+                else:
+                    self._skip()
+                char = self._peek()
+                self.pos += 1
+                if char == "}":
+                    return
+                if char != ",":
+                    self._fail("Expecting ',' delimiter")
+        else:
+            self._skip()
+
+    def _decode(self) -> Any:
+        """Decodes the value starting at the current position."""
+
+        self._peek()
+        try:
+            # Fast path: the value is usually complete within the buffered text. A number that
+            # ends flush with the buffer or at a character that could continue it (e.g. the
+            # "." of "-2500." + "0") may be truncated, so it is re-read below.
+            value, end = self._decoder.raw_decode(self.buf, self.pos)
+            if end < len(self.buf) and not (
+                type(value) in (int, float) and self.buf[end] in _NUMBER_CHARS
+            ):
+                self.pos = end
+                self._compact()
+                return value
+        except json.JSONDecodeError:
+            pass
+        self._value_end(self.pos)  # buffer the whole value, then decode it once
+        value, self.pos = self._decoder.raw_decode(self.buf, self.pos)
+        self._compact()
+        return value
+
+    def _skip(self) -> None:
+        """Advances past the value starting at the current position without decoding it.
+        Text scanned while skipping is discarded as further chunks are read."""
+
+        self._peek()
+        self.pos = self._value_end(self.pos, discard=True)
+        self._compact()
+
+    def _value_end(self, i: int, discard: bool = False) -> int:
+        """Returns the index one past the end of the value starting at < i >, reading further
+        chunks as required. If < discard > is True text before the scan position may be
+        dropped from the buffer."""
+
+        char = self.buf[i]
+        if char == '"':
+            return self._string_end(i + 1, discard)
+        if char in "[{":
+            depth = 0
+            while True:
+                match = _STRUCTURAL.search(self.buf, i)
+                if match is None:
+                    i = self._more(len(self.buf), discard, "Unterminated array or object")
+                    continue
+                i = match.end()
+                if match.group() == '"':
+                    i = self._string_end(i, discard)
+                elif match.group() in "[{":
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        return i
+        while True:
+            match = _SCALAR_END.search(self.buf, i)
+            if match is not None:
+                return match.start()
+            i = self._more(len(self.buf), discard, None)
+            if i < 0:
+                return len(self.buf)
+
+    def _string_end(self, i: int, discard: bool = False) -> int:
+        """Returns the index one past the closing quote of a string whose content starts at
+        < i >."""
+
+        while True:
+            match = _STRING_END.search(self.buf, i)
+            if match is None:
+                i = self._more(len(self.buf), discard, "Unterminated string")
+            elif match.group() == '"':
+                return match.end()
+            elif match.end() < len(self.buf):
+                i = match.end() + 1  # skip the escaped character
+            else:
+                i = self._more(match.start(), discard, "Unterminated string")
+
+    def _more(self, i: int, discard: bool, error: Optional[str]) -> int:
+        """Reads the next chunk and returns scan index < i > adjusted for any text discarded
+        from the buffer. At end of input raises < error > or, if None, returns -1."""
+
+        if discard and i > self.pos:
+            self.buf = self.buf[i:]
+            self.pos = i = 0
+        if not self._fill():
+            if error is None:
+                return -1
+            self._fail(error, len(self.buf))
+        return i
+
+    def _peek(self, eof_ok: bool = False) -> str:
+        """Skips whitespace and returns the next character without consuming it."""
+
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                if eof_ok:
+                    return ""
+                self._fail("Expecting value")
+
+    def _fill(self) -> bool:
+        """Appends the next non-empty chunk to the buffer. Returns False at end of input."""
+
+        for chunk in self._chunks:
+            if chunk:
+                self.buf += chunk
+                return True
+        return False
+
+    def _compact(self) -> None:
+        """Discards consumed text once it makes up the larger part of the buffer."""
+
+        if self.pos > len(self.buf) >> 1:
+            self.buf = self.buf[self.pos :]
+            self.pos = 0
+
+    def _fail(self, msg: str, pos: Optional[int] = None) -> None:
+        raise json.JSONDecodeError(msg, self.buf, self.pos if pos is None else pos)
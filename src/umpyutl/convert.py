@@ -1,4 +1,97 @@
-from typing import Any, Optional
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Optional, Sequence
+
+SCHEMA_TYPES = ("float", "int", "list", "str")
+
+
+def compile_row_converter(
+    fieldnames: Sequence[str], schema: Dict[str, Any], as_dict: bool = True
+) -> Callable[[Sequence[str]], dict | tuple]:
+    """Compiles a < schema > that maps field names to types into a specialized function that
+    converts a row of string values (e.g., a list returned by the csv.reader()) in a single
+    call. The function is generated once per schema with one expression per field, so a
+    row costs a single try block instead of a < to_* > call and str.replace() per value.
+
+    Schema types are "float", "int", "str" (unchanged), "list" (split on whitespace),
+    ("list", delimiter) or any callable that accepts a string. Fields omitted from the schema
+    are treated as "str". Values that the fast path cannot convert (e.g., "1,000", "4.98"
+    for an "int", or "") fall back to < to_float >, < to_int > and < to_list > for that value
+    only, so a value converts the same way whatever the rest of its row holds, and values
+    that cannot be converted are returned unchanged. Missing trailing values are treated as
+    None.
+
+    Parameters:
+        fieldnames (seq): field names in row order
+        schema (dict): mapping of field name to type
+        as_dict (bool): return dicts keyed by field name; if False return tuples
+
+    Returns:
+        function: row converter
+    """
+
+    namespace, exprs, fast, slow = {}, [], [], []
+    for i, name in enumerate(fieldnames):
+        spec = schema.get(name, "str")
+        value = f"row[{i}]"
+        if callable(spec):
+            namespace[f"_func_{i}"] = spec
+            exprs.append(f"_func_{i}({value})")
+            fast.append(spec)
+            slow.append(spec)
+        elif spec == "str":
+            exprs.append(value)
+            fast.append(None)
+            slow.append(None)
+        elif spec in ("float", "int"):
+            exprs.append(f"{spec}({value})")
+            fast.append(float if spec == "float" else int)
+            slow.append(to_float if spec == "float" else to_int)
+        elif spec == "list":
+            exprs.append(f"{value}.strip().split()")
+            fast.append(str.split)
+            slow.append(to_list)
+        elif isinstance(spec, tuple) and len(spec) == 2 and spec[0] == "list":
+            namespace[f"_delimiter_{i}"] = spec[1]
+            exprs.append(f"{value}.strip().split(_delimiter_{i})")
+            fast.append(partial(_split, delimiter=spec[1]))
+            slow.append(partial(to_list, delimiter=spec[1]))
+        else:
+            raise ValueError(
+                f"Invalid schema type {spec!r} for {name!r}; use one of {SCHEMA_TYPES}, "
+                "('list', delimiter) or a callable."
+            )
+
+    fieldnames = tuple(fieldnames)
+    width = len(fieldnames)
+
+    def convert_slow(row: Sequence[str]) -> dict | tuple:
+        row = list(row) + [None] * (width - len(row))
+        values = []
+        for fast_func, slow_func, val in zip(fast, slow, row):
+            if fast_func is None:
+                values.append(val)
+                continue
+            try:  # same conversion as the fast path unless the value itself fails
+                values.append(fast_func(val))
+            except (AttributeError, IndexError, TypeError, ValueError):
+                values.append(slow_func(val))
+        return dict(zip(fieldnames, values)) if as_dict else tuple(values)
+
+    if as_dict:
+        body = "{" + ", ".join(f"{name!r}: {expr}" for name, expr in zip(fieldnames, exprs)) + "}"
+    else:
+        body = f"({', '.join(exprs)},)" if exprs else "()"
+    namespace.update(_convert_slow=convert_slow, float=float, int=int)
+    code = (
+        "def convert_row(row):\n"
+        "    try:\n"
+        f"        return {body}\n"
+        "    except (AttributeError, IndexError, TypeError, ValueError):\n"
+        "        return _convert_slow(row)\n"
+    )
+    exec(code, namespace)
+    return namespace["convert_row"]
 
 
 def to_float(value: str) -> float | Any:
@@ -19,6 +112,25 @@ def to_float(value: str) -> float | Any:
         return value
 
 
+def to_frozen(value: Any) -> Any:
+    """Returns a read-only view of < value > suitable for sharing between callers. Dictionaries
+    are converted recursively to < types.MappingProxyType > views and lists to tuples. Other
+    values are returned unchanged.
+
+    Parameters:
+        value (any): value to be frozen, typically decoded JSON
+
+    Returns:
+        any: immutable representation of the value
+    """
+
+    if isinstance(value, dict):
+        return MappingProxyType({key: to_frozen(val) for key, val in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(to_frozen(val) for val in value)
+    return value
+
+
 def to_int(value: str) -> int | Any:
     """Attempts to convert a < value > to an integer including numeric strings that include one or
     more thousand separator commas (e.g., "1,000,000") or a period designating a fractional
@@ -59,3 +171,9 @@ def to_list(value: str, delimiter: Optional[str] = None) -> list | Any:
             return value.strip().split()
     except (AttributeError, TypeError, ValueError):
         return value
+
+
+def _split(value: str, delimiter: str) -> list:
+    """Strips < value > and splits it on < delimiter >."""
+
+    return value.strip().split(delimiter)
@@ -1,35 +1,1537 @@
+import asyncio
+import bisect
+import codecs
+import copy
+import functools
+import hashlib
+import inspect
+import json
+import os
+import pathlib
+import queue
+import random
 import requests as req
-from typing import Optional
+import sys
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from http.cookiejar import DefaultCookiePolicy
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from types import MappingProxyType
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 
+from . import convert
+from ._jsonstream import JSONStreamReader
 
-def get_resource(url: str, params: Optional[dict] = None, timeout: int = 10) -> req.Response:
-    """Returns a response object.
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "currsize", "maxsize", "currbytes", "max_bytes"]
+)
+RequestTiming = namedtuple(
+    "RequestTiming",
+    ["url", "host", "status", "connect", "ttfb", "total", "bytes_received", "reused"],
+)
+RequestTiming.__doc__ = """Timing of a single request attempt reported to client observers.
+
+    Attributes:
+        url (str): final url of the response
+        host (str): host (and port) of the response url
+        status (int): HTTP status code
+        connect (float): seconds spent establishing connections (DNS, TCP and TLS), 0 if reused
+        ttfb (float): seconds from sending the request to receiving the response headers
+        total (float): seconds from sending the request to receiving the whole body
+        bytes_received (int): body size in bytes (Content-Length if the body was streamed)
+        reused (bool): True if the request was sent over a pooled keep-alive connection
+"""
+
+_timing = threading.local()
+
+
+class _ConnectTimer:
+    """Connection mixin that accumulates time spent in < connect > on the calling thread."""
+
+    def connect(self) -> None:
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _timing.connect = getattr(_timing, "connect", 0.0) + time.perf_counter() - start
+
+
+class _TimedHTTPConnection(_ConnectTimer, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_ConnectTimer, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _TimedHTTPAdapter(HTTPAdapter):
+    """Transport adapter whose connection pools record connection setup time."""
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+class _NoCookiePolicy(DefaultCookiePolicy):
+    """Cookie policy that refuses to store any cookie."""
+
+    def set_ok(self, cookie, request) -> bool:
+        return False
+
+
+class ResponseCache:
+    """Persistent on-disk cache of successful GET responses keyed by url and querystring
+    parameters. Each entry stores the response body together with its validators (ETag,
+    Last-Modified). Fresh entries are served from disk without a request; stale entries are
+    revalidated with a conditional request (If-None-Match, If-Modified-Since) and served from
+    disk when the server answers 304 Not Modified.
+
+    An entry is fresh while its age is less than the response Cache-Control max-age or,
+    failing that, the cache < max_age >. When the total size of stored bodies exceeds
+    < max_bytes > the least recently used entries are evicted.
+
+    Parameters:
+        directory (pathlib.Path | str): cache directory (created if it does not exist)
+        max_bytes (int): maximum total size of cached bodies in bytes
+        max_age (int): default freshness lifetime in seconds (0 = always revalidate)
+    """
+
+    def __init__(
+        self,
+        directory: pathlib.Path | str,
+        max_bytes: int = 256 * 1024 * 1024,
+        max_age: int = 0,
+    ) -> None:
+        self.directory = pathlib.Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._size = sum(path.stat().st_size for path in self.directory.glob("*.body"))
+
+    @staticmethod
+    def key(url: str, params: Optional[dict] = None) -> str:
+        """Returns the cache key for a url and its querystring parameters.
+
+        Parameters:
+            url (str): a url that specifies the resource.
+            params (dict): optional dictionary of querystring arguments.
+
+        Returns:
+            str: hex digest identifying the cache entry
+        """
+
+        if params:
+            params = sorted(params.items())
+        prepared = req.Request("GET", url, params=params).prepare()
+        return hashlib.sha256(prepared.url.encode("utf-8")).hexdigest()
+
+    def lookup(self, url: str, params: Optional[dict] = None) -> Optional[dict]:
+        """Returns the stored metadata for a url and params or None if not cached.
+
+        Parameters:
+            url (str): a url that specifies the resource.
+            params (dict): optional dictionary of querystring arguments.
+
+        Returns:
+            dict: entry metadata or None
+        """
+
+        meta_path = self.directory.joinpath(self.key(url, params)).with_suffix(".json")
+        try:
+            with open(meta_path, "r", encoding="utf-8") as file_obj:
+                return json.load(file_obj)
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, entry: dict) -> bool:
+        """Returns True if the entry may be served without revalidation.
+
+        Parameters:
+            entry (dict): entry metadata
+
+        Returns:
+            bool: True if the entry is fresh
+        """
+
+        max_age = entry["max_age"] if entry["max_age"] is not None else self.max_age
+        return time.time() - entry["stored_at"] < max_age
+
+    @staticmethod
+    def conditional_headers(entry: dict) -> dict:
+        """Returns the conditional request headers derived from the entry validators.
+
+        Parameters:
+            entry (dict): entry metadata
+
+        Returns:
+            dict: If-None-Match and/or If-Modified-Since headers
+        """
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def load(self, entry: dict) -> Optional[req.Response]:
+        """Rebuilds a response object from a stored entry. Marks the entry as recently used.
+
+        Parameters:
+            entry (dict): entry metadata
+
+        Returns:
+            Response: response served from disk or None if the body is missing
+        """
+
+        body_path = self.directory.joinpath(entry["key"]).with_suffix(".body")
+        try:
+            with open(body_path, "rb") as file_obj:
+                body = file_obj.read()
+            os.utime(body_path)  # LRU bookkeeping
+        except OSError:
+            return None
+
+        response = req.Response()
+        response.status_code = entry["status"]
+        response.reason = entry["reason"]
+        response.url = entry["url"]
+        response.encoding = entry["encoding"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = body
+        response.from_cache = True
+        return response
+
+    def store(self, url: str, params: Optional[dict], response: req.Response) -> None:
+        """Stores a 200 OK response unless its Cache-Control header forbids storage or the
+        response carries neither validators nor a freshness lifetime.
+
+        Parameters:
+            url (str): a url that specifies the resource.
+            params (dict): optional dictionary of querystring arguments.
+            response (Response): response to store
+
+        Returns:
+            None
+        """
+
+        if response.status_code != 200:
+            return
+        directives = _cache_control(response.headers)
+        if "no-store" in directives:
+            return
+        max_age = _max_age(directives)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not (etag or last_modified or max_age or self.max_age):
+            return
+
+        key = self.key(url, params)
+        body = response.content
+        headers = {
+            k: v
+            for k, v in response.headers.items()
+            if k.lower() not in ("content-encoding", "transfer-encoding", "content-length")
+        }
+        headers["Content-Length"] = str(len(body))
+        entry = {
+            "key": key,
+            "url": response.url,
+            "status": response.status_code,
+            "reason": response.reason,
+            "encoding": response.encoding,
+            "headers": headers,
+            "etag": etag,
+            "last_modified": last_modified,
+            "max_age": max_age,
+            "stored_at": time.time(),
+            "size": len(body),
+        }
+
+        body_path = self.directory.joinpath(key).with_suffix(".body")
+        previous = body_path.stat().st_size if body_path.exists() else 0
+        _replace_file(body_path, body)
+        _replace_file(body_path.with_suffix(".json"), json.dumps(entry).encode("utf-8"))
+        with self._lock:
+            self._size += len(body) - previous
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def revalidated(self, entry: dict, response: req.Response) -> Optional[req.Response]:
+        """Refreshes an entry after a 304 Not Modified response and returns the stored
+        response.
+
+        Parameters:
+            entry (dict): entry metadata
+            response (Response): the 304 response
+
+        Returns:
+            Response: response served from disk or None if the body is missing
+        """
+
+        directives = _cache_control(response.headers)
+        entry["stored_at"] = time.time()
+        entry["max_age"] = _max_age(directives)
+        for name in ("ETag", "Last-Modified", "Cache-Control", "Expires", "Date"):
+            if name in response.headers:
+                entry["headers"][name] = response.headers[name]
+        entry["etag"] = response.headers.get("ETag", entry["etag"])
+        entry["last_modified"] = response.headers.get("Last-Modified", entry["last_modified"])
+        meta_path = self.directory.joinpath(entry["key"]).with_suffix(".json")
+        _replace_file(meta_path, json.dumps(entry).encode("utf-8"))
+        return self.load(entry)
+
+    def clear(self) -> None:
+        """Removes every entry from the cache.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            for path in self.directory.glob("*.body"):
+                path.with_suffix(".json").unlink(missing_ok=True)
+                path.unlink(missing_ok=True)
+            self._size = 0
+
+    def _evict(self) -> None:
+        """Deletes least recently used entries until the cache is within < max_bytes >."""
+
+        entries = []
+        for path in self.directory.glob("*.body"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        self._size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self._size <= self.max_bytes:
+                break
+            path.with_suffix(".json").unlink(missing_ok=True)
+            path.unlink(missing_ok=True)
+            self._size -= size
+
+
+def _cache_control(headers: CaseInsensitiveDict) -> dict:
+    """Parses a Cache-Control header into a dictionary of directives."""
+
+    directives = {}
+    for directive in headers.get("Cache-Control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"')
+    return directives
+
+
+def _max_age(directives: dict) -> Optional[int]:
+    """Returns the Cache-Control max-age in seconds (0 if no-cache) or None if absent."""
+
+    if "no-cache" in directives:
+        return 0
+    try:
+        return int(directives["max-age"])
+    except (KeyError, ValueError):
+        return None
+
+
+def _replace_file(filepath: pathlib.Path, data: bytes) -> None:
+    """Atomically replaces the content of < filepath > with < data >."""
+
+    tmp_path = filepath.with_name(f"{filepath.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp_path, "wb") as file_obj:
+        file_obj.write(data)
+    os.replace(tmp_path, filepath)
+
+
+class SingleFlight:
+    """Coalesces concurrent identical calls. While a call for a given key is in flight,
+    further callers with the same key wait for it and receive its result (or exception)
+    instead of issuing their own. Supports threaded callers via < do > and asyncio callers
+    via < do_async >.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict = {}
+        self._tasks: dict = {}
+
+    def do(self, key: Any, func: Callable, *args, **kwargs) -> Any:
+        """Calls < func > unless an identical call is already in flight in another thread,
+        in which case its outcome is shared.
+
+        Parameters:
+            key (hashable): identifies identical calls
+            func (callable): function to call
+            args: positional arguments passed to < func >
+            kwargs: keyword arguments passed to < func >
+
+        Returns:
+            any: return value of the (shared) call
+        """
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = {"done": threading.Event(), "error": None}
+
+        if not leader:
+            call["done"].wait()
+            if call["error"] is not None:
+                raise call["error"]
+            return call["result"]
+
+        try:
+            call["result"] = func(*args, **kwargs)
+            return call["result"]
+        except BaseException as err:
+            call["error"] = err
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call["done"].set()
+
+    async def do_async(self, key: Any, func: Callable, *args, **kwargs) -> Any:
+        """Awaits the coroutine function < func > unless an identical call is already in
+        flight on the running event loop, in which case its outcome is shared. Cancelling one
+        waiter does not cancel the shared call.
+
+        Parameters:
+            key (hashable): identifies identical calls
+            func (callable): coroutine function to await
+            args: positional arguments passed to < func >
+            kwargs: keyword arguments passed to < func >
+
+        Returns:
+            any: return value of the (shared) call
+        """
+
+        loop_key = (asyncio.get_running_loop(), key)
+        with self._lock:
+            task = self._tasks.get(loop_key)
+            if task is None:
+                task = self._tasks[loop_key] = asyncio.ensure_future(func(*args, **kwargs))
+                task.add_done_callback(lambda _: self._forget(loop_key))
+        return await asyncio.shield(task)
+
+    def _forget(self, loop_key: tuple) -> None:
+        with self._lock:
+            self._tasks.pop(loop_key, None)
+
+
+class RateLimiter:
+    """Client-side token bucket rate limiter. Each host (or, if < per_host > is False, the
+    limiter as a whole) is granted < rate > requests per second with bursts of up to < burst >
+    requests. Callers that exceed the budget reserve a future slot and sleep until it arrives,
+    so concurrent callers are released at the permitted rate in arrival order.
+
+    Parameters:
+        rate (float): sustained requests per second
+        burst (int): maximum number of requests that may be issued back-to-back
+        per_host (bool): if True maintain a separate bucket for each host
+    """
+
+    def __init__(self, rate: float, burst: int = 1, per_host: bool = True) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1.")
+        self.rate = rate
+        self.burst = burst
+        self.per_host = per_host
+        self._lock = threading.Lock()
+        self._buckets: dict = {}  # host -> [tokens, last refill]
+
+    def acquire(self, url: str) -> float:
+        """Takes a token for the host of < url >, sleeping until one is available.
+
+        Parameters:
+            url (str): url of the request about to be issued
+
+        Returns:
+            float: seconds spent waiting
+        """
+
+        with self._lock:
+            bucket = self._refill(url)
+            bucket[0] -= 1
+            delay = -bucket[0] / self.rate if bucket[0] < 0 else 0.0
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    def penalize(self, url: str, delay: float) -> None:
+        """Withholds tokens for the host of < url > for < delay > seconds (e.g., after a 429
+        Too Many Requests response) so that every caller backs off, not just the one that was
+        rejected.
+
+        Parameters:
+            url (str): url of the rejected request
+            delay (float): seconds before the next request may be issued
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            bucket = self._refill(url)
+            bucket[0] = min(bucket[0], 0.0) - delay * self.rate
+
+    def _refill(self, url: str) -> list:
+        """Returns the bucket for < url > topped up for the time elapsed since last use."""
+
+        host = urlsplit(url).netloc if self.per_host else None
+        now = time.monotonic()
+        bucket = self._buckets.setdefault(host, [float(self.burst), now])
+        bucket[0] = min(float(self.burst), bucket[0] + (now - bucket[1]) * self.rate)
+        bucket[1] = now
+        return bucket
+
+
+class Retry:
+    """Retry policy for failed requests. Connection errors, timeouts and responses with a
+    retryable status code are retried up to < total > times after an exponential backoff
+    with full jitter. A Retry-After header, if present, takes precedence over the backoff.
+
+    Parameters:
+        total (int): maximum number of retries
+        backoff_factor (float): base delay in seconds, doubled after each attempt
+        max_backoff (float): upper bound of the computed backoff in seconds
+        jitter (bool): if True randomize each delay between zero and the computed backoff
+        statuses (seq): HTTP status codes that are retried
+        respect_retry_after (bool): if True honor the Retry-After response header
+    """
+
+    def __init__(
+        self,
+        total: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 60.0,
+        jitter: bool = True,
+        statuses: Sequence[int] = (429, 500, 502, 503, 504),
+        respect_retry_after: bool = True,
+    ) -> None:
+        self.total = total
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.respect_retry_after = respect_retry_after
+
+    def is_retryable(self, response: Optional[req.Response], error: Optional[Exception]) -> bool:
+        """Returns True if the outcome of a request warrants a retry.
+
+        Parameters:
+            response (Response): server response or None if the request raised
+            error (Exception): raised exception or None
+
+        Returns:
+            bool: True if the request should be retried
+        """
+
+        if error is not None:
+            return isinstance(error, (req.ConnectionError, req.Timeout))
+        return response.status_code in self.statuses
+
+    def delay(self, attempt: int, response: Optional[req.Response] = None) -> float:
+        """Returns the number of seconds to wait before retry number < attempt > + 1.
+
+        Parameters:
+            attempt (int): zero-based number of retries already made
+            response (Response): optional response of the failed attempt
+
+        Returns:
+            float: delay in seconds
+        """
+
+        if self.respect_retry_after and response is not None:
+            retry_after = _retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after
+        backoff = min(self.max_backoff, self.backoff_factor * 2**attempt)
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses a Retry-After header (delay in seconds or HTTP-date) into seconds."""
+
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _content_length(value: Optional[str]) -> Optional[int]:
+    """Parses a Content-Length header into a positive byte count. Missing, zero, malformed or
+    comma-joined values (e.g., "12, 12") yield None."""
+
+    try:
+        return int(value) or None
+    except (TypeError, ValueError):
+        return None
+
+
+class TimingHistogram:
+    """Client observer that aggregates request timings per host into histograms with
+    logarithmically spaced buckets (1 ms doubling to ~33 s) for the connect, ttfb and total
+    phases, along with request, reuse and byte counters.
+
+    Parameters:
+        None
+    """
+
+    BOUNDS = tuple(0.001 * 2**i for i in range(16))
+    METRICS = ("connect", "ttfb", "total")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hosts: dict = {}
+
+    def __call__(self, timing: RequestTiming) -> None:
+        with self._lock:
+            host = self._hosts.get(timing.host)
+            if host is None:
+                host = self._hosts[timing.host] = {
+                    "count": 0,
+                    "reused": 0,
+                    "bytes_received": 0,
+                    **{metric: [0] * (len(self.BOUNDS) + 1) for metric in self.METRICS},
+                    **{f"{metric}_sum": 0.0 for metric in self.METRICS},
+                }
+            host["count"] += 1
+            host["reused"] += timing.reused
+            host["bytes_received"] += timing.bytes_received or 0
+            for metric in self.METRICS:
+                value = getattr(timing, metric)
+                host[metric][bisect.bisect_left(self.BOUNDS, value)] += 1
+                host[f"{metric}_sum"] += value
+
+    def histogram(self, host: str, metric: str = "total") -> List[Tuple[float, int]]:
+        """Returns the bucket counts of a phase for a host as (upper bound, count) pairs; the
+        final bucket has an upper bound of infinity.
+
+        Parameters:
+            host (str): host (and port)
+            metric (str): "connect", "ttfb" or "total"
+
+        Returns:
+            list: (upper bound in seconds, count) pairs
+        """
+
+        with self._lock:
+            counts = list(self._hosts[host][metric])
+        return list(zip(self.BOUNDS + (float("inf"),), counts))
+
+    def summary(self) -> dict:
+        """Returns per-host request counts, connection reuse, bytes received and the mean,
+        50th and 95th percentile (bucket upper bound) of each phase.
+
+        Parameters:
+            None
+
+        Returns:
+            dict: per-host summary keyed by host
+        """
+
+        summary = {}
+        with self._lock:
+            for name, host in self._hosts.items():
+                summary[name] = {
+                    "count": host["count"],
+                    "reused": host["reused"],
+                    "bytes_received": host["bytes_received"],
+                }
+                for metric in self.METRICS:
+                    summary[name][metric] = {
+                        "mean": host[f"{metric}_sum"] / host["count"],
+                        "p50": _percentile(self.BOUNDS, host[metric], 0.5),
+                        "p95": _percentile(self.BOUNDS, host[metric], 0.95),
+                    }
+        return summary
+
+
+def _percentile(bounds: Sequence[float], counts: Sequence[int], fraction: float) -> float:
+    """Returns the upper bound of the bucket containing the given percentile."""
+
+    target = fraction * sum(counts)
+    cumulative = 0
+    for bound, count in zip(tuple(bounds) + (float("inf"),), counts):
+        cumulative += count
+        if count and cumulative >= target:
+            return bound
+    return 0.0
+
+
+class Client:
+    """Reusable HTTP client backed by a pooled < requests.Session >. Connections to a host
+    are kept alive and returned to a per-host pool after each request, avoiding a fresh
+    TCP/TLS handshake on every call.
+
+    Parameters:
+        pool_connections (int): number of per-host connection pools to cache
+        pool_maxsize (int): maximum number of connections kept alive per host
+        headers (dict): optional default headers sent with every request
+        timeout (int): default timeout value in seconds
+        pool_block (bool): if True block when the per-host pool is exhausted rather than
+                           opening (and later discarding) an extra connection
+        cache (ResponseCache): optional on-disk response cache
+        coalesce (bool): if True concurrent identical requests (same url, params and
+                         headers) share a single in-flight request
+        limiter (RateLimiter): optional client-side rate limiter
+        retry (Retry): optional retry policy
+        observers (seq): optional callables that receive a < RequestTiming > after each
+                         request attempt (see < TimingHistogram >)
+        cookies (bool): if True (the < requests.Session > default) cookies set by responses
+                        are stored and sent with later requests to the same domain; if False
+                        no cookies are stored, so each request is as stateless as
+                        < requests.get > (cookies passed per request are still sent)
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        headers: Optional[dict] = None,
+        timeout: int = 10,
+        pool_block: bool = False,
+        cache: Optional[ResponseCache] = None,
+        coalesce: bool = False,
+        limiter: Optional[RateLimiter] = None,
+        retry: Optional[Retry] = None,
+        observers: Optional[Sequence[Callable[[RequestTiming], None]]] = None,
+        cookies: bool = True,
+    ) -> None:
+        self.timeout = timeout
+        self.cache = cache
+        self.flight = SingleFlight() if coalesce else None
+        self.limiter = limiter
+        self.retry = retry
+        self.observers = list(observers or [])
+        self._stats_lock = threading.Lock()
+        self._stats = {"requests": 0, "retries": 0, "wait_time": 0.0, "work_time": 0.0}
+        self.session = req.Session()
+        if not cookies:
+            self.session.cookies.set_policy(_NoCookiePolicy())
+        adapter = _TimedHTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if headers:
+            self.session.headers.update(headers)
+
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the underlying session and releases pooled connections.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        self.session.close()
+
+    def stats(self) -> dict:
+        """Returns request counters and the cumulative time spent waiting (rate limiting and
+        retry backoff) versus working (issuing requests and receiving responses).
+
+        Parameters:
+            None
+
+        Returns:
+            dict: requests, retries, wait_time and work_time (seconds)
+        """
+
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def get(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        timeout: Optional[int] = None,
+        headers: Optional[dict] = None,
+        **kwargs,
+    ) -> req.Response:
+        """Issues a GET request over a pooled connection. Returns a response object.
+
+        Parameters:
+            url (str): a url that specifies the resource.
+            params (dict): optional dictionary of querystring arguments.
+            timeout (int): timeout value in seconds; defaults to the client timeout
+            headers (dict): optional headers merged with the client default headers
+            kwargs: additional keyword arguments passed to < requests.Session.get >
+
+        Returns:
+            Response: contains a server response to an HTTP request.
+        """
+
+        if timeout is None:
+            timeout = self.timeout
+        if self.flight is not None and not kwargs.get("stream"):
+            key = self.flight_key(url, params, headers, **kwargs)
+            return self.flight.do(key, self._get, url, params, timeout, headers, **kwargs)
+        return self._get(url, params, timeout, headers, **kwargs)
+
+    def flight_key(
+        self, url: str, params: Optional[dict] = None, headers: Optional[dict] = None, **kwargs
+    ) -> tuple:
+        """Returns the key used to coalesce identical requests.
+
+        Parameters:
+            url (str): a url that specifies the resource.
+            params (dict): optional dictionary of querystring arguments.
+            headers (dict): optional request headers
+            kwargs: additional keyword arguments passed to < requests.Session.get >
+
+        Returns:
+            tuple: hashable request identity
+        """
+
+        return (url, _hashable(params or {}), _hashable(headers or {}), _hashable(kwargs))
+
+    def _get(
+        self, url: str, params: Optional[dict], timeout: int, headers: Optional[dict], **kwargs
+    ) -> req.Response:
+        """Issues the GET request, consulting the response cache if one is configured."""
+
+        if self.cache is None or kwargs.get("stream"):
+            return self._send(url, params, timeout, headers, **kwargs)
+
+        entry = self.cache.lookup(url, params)
+        if entry is not None:
+            if self.cache.is_fresh(entry):
+                cached = self.cache.load(entry)
+                if cached is not None:
+                    return cached
+            headers = {**(headers or {}), **self.cache.conditional_headers(entry)}
+
+        response = self._send(url, params, timeout, headers, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            cached = self.cache.revalidated(entry, response)
+            if cached is not None:
+                return cached
+            # Body evicted between lookup and load; fetch unconditionally.
+            for name in ("If-None-Match", "If-Modified-Since"):
+                headers.pop(name, None)
+            response = self._send(url, params, timeout, headers, **kwargs)
+        self.cache.store(url, params, response)
+        return response
+
+    def _send(
+        self, url: str, params: Optional[dict], timeout: int, headers: Optional[dict], **kwargs
+    ) -> req.Response:
+        """Issues the GET request subject to the rate limiter and retry policy."""
+
+        attempt = 0
+        while True:
+            if self.limiter is not None:
+                self._tally(wait_time=self.limiter.acquire(url))
+            response, error = None, None
+            _timing.connect = 0.0
+            start = time.perf_counter()
+            try:
+                response = self.session.get(
+                    url, params=params, timeout=timeout, headers=headers, **kwargs
+                )
+            except req.RequestException as err:
+                error = err
+            finally:
+                elapsed = time.perf_counter() - start
+                self._tally(requests=1, work_time=elapsed)
+            if response is not None and self.observers:
+                self._observe(response, _timing.connect, elapsed, kwargs.get("stream", False))
+
+            if (
+                self.retry is None
+                or attempt >= self.retry.total
+                or not self.retry.is_retryable(response, error)
+            ):
+                if error is not None:
+                    raise error
+                return response
+
+            delay = self.retry.delay(attempt, response)
+            if response is not None:
+                if response.status_code == 429 and self.limiter is not None:
+                    self.limiter.penalize(url, delay)
+                    delay = 0.0  # the limiter enforces the delay on the next acquire
+                response.close()
+            attempt += 1
+            self._tally(retries=1, wait_time=delay)
+            time.sleep(delay)
+
+    def _observe(
+        self, response: req.Response, connect: float, total: float, stream: bool
+    ) -> None:
+        """Reports the timing of a request attempt to the client observers."""
+
+        if stream:
+            bytes_received = _content_length(response.headers.get("Content-Length"))
+        else:
+            bytes_received = len(response.content)
+        timing = RequestTiming(
+            response.url,
+            urlsplit(response.url).netloc,
+            response.status_code,
+            connect,
+            response.elapsed.total_seconds(),
+            total,
+            bytes_received,
+            connect == 0.0,
+        )
+        for observer in self.observers:
+            observer(timing)
+
+    def _tally(self, **amounts) -> None:
+        with self._stats_lock:
+            for name, amount in amounts.items():
+                self._stats[name] += amount
+
+    def get_json(
+        self,
+        url: str,
+        params: Optional[dict] = None,
+        timeout: Optional[int] = None,
+        headers: Optional[dict] = None,
+    ) -> dict | list:
+        """Issues a GET request and returns the response decoded into a dictionary or list.
+
+        Parameters:
+            url (str): a url that specifies the resource.
+            params (dict): optional dictionary of querystring arguments.
+            timeout (int): timeout value in seconds; defaults to the client timeout
+            headers (dict): optional headers merged with the client default headers
+
+        Returns:
+            dict | list: dictionary or list representation of the decoded JSON.
+        """
+
+        return self.get(url, params, timeout=timeout, headers=headers).json()
+
+
+_default_client: Optional[Client] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_client() -> Client:
+    """Returns the module-level shared client, creating it on first use. The shared client
+    is used by < get_resource > and < get_resource_json > when no client is passed. It is
+    created with < cookies=False > so that callers share pooled connections but not cookie
+    state; pass a < Client > of your own to keep cookies between requests.
+
+    Parameters:
+        None
+
+    Returns:
+        Client: the shared pooled client
+    """
+
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = Client(cookies=False)
+    return _default_client
+
+
+def set_default_client(client: Optional[Client]) -> None:
+    """Replaces the module-level shared client (e.g., to change the pool size or default
+    headers). The previous client, if any, is closed. Pass None to reset to a lazily created
+    client with default settings (see < get_default_client >).
+
+    Parameters:
+        client (Client): client to share or None
+
+    Returns:
+        None
+    """
+
+    global _default_client
+    with _default_client_lock:
+        previous, _default_client = _default_client, client
+    if previous is not None and previous is not client:
+        previous.close()
+
+
+def get_resource(
+    url: str,
+    params: Optional[dict] = None,
+    timeout: Optional[int] = None,
+    client: Optional[Client] = None,
+) -> req.Response:
+    """Returns a response object. Requests are issued over the pooled connections of the
+    provided < client > or, if none is provided, the module-level shared client.
 
     Parameters:
         url (str): a url that specifies the resource.
         params (dict): optional dictionary of querystring arguments.
-        timeout (int): timeout value in seconds
+        timeout (int): timeout value in seconds; defaults to the client timeout
+        client (Client): optional client; defaults to the shared client
 
     Returns:
         Response: contains a server response to an HTTP request.
     """
 
-    if params:
-        return req.get(url, params, timeout=timeout)
-    else:
-        return req.get(url, timeout=timeout)
+    if client is None:
+        client = get_default_client()
+    return client.get(url, params, timeout=timeout)
 
 
-def get_resource_json(url: str, params: Optional[dict] = None, timeout: int = 10) -> dict | list:
+def get_resource_json(
+    url: str,
+    params: Optional[dict] = None,
+    timeout: Optional[int] = None,
+    client: Optional[Client] = None,
+) -> dict | list:
     """Returns a response object decoded into a dictionary or list.
 
     Parameters:
         url (str): a url that specifies the resource.
         params (dict): optional dictionary of querystring arguments.
-        timeout (int): timeout value in seconds
+        timeout (int): timeout value in seconds; defaults to the client timeout
+        client (Client): optional client; defaults to the shared client
 
     Returns:
         dict | list: dictionary or list representation of the decoded JSON.
     """
 
-    return get_resource(url, params, timeout=timeout).json()
+    return get_resource(url, params, timeout=timeout, client=client).json()
+
+
+def memoize(
+    maxsize: int = 256,
+    max_bytes: int = 64 * 1024 * 1024,
+    ttl: float = 60.0,
+    mode: str = "copy",
+) -> Callable:
+    """Decorator that memoizes a JSON-returning function such as < get_resource_json > in
+    process memory. Calls are keyed by their bound arguments (excluding < timeout >) and
+    results are held for < ttl > seconds. The least recently used entries are evicted once
+    either < maxsize > entries or an estimated < max_bytes > of memory are held.
+
+    Cached results are protected from caller mutation. In "copy" mode each caller receives
+    a deep copy; in "freeze" mode the result is stored and returned as a read-only view (see
+    < convert.to_frozen >), which avoids the copy.
+
+    The decorated function keeps its signature and gains < cache_info() > and
+    < cache_clear() > methods.
+
+    Parameters:
+        maxsize (int): maximum number of cached results
+        max_bytes (int): approximate memory budget for cached results in bytes
+        ttl (float): time-to-live of a cached result in seconds
+        mode (str): "copy" (copy-on-read) or "freeze" (read-only views)
+
+    Returns:
+        callable: decorator
+    """
+
+    if mode not in ("copy", "freeze"):
+        raise ValueError("mode must be 'copy' or 'freeze'.")
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        entries: OrderedDict = OrderedDict()  # key -> (expires, nbytes, value)
+        lock = threading.Lock()
+        stats = {"hits": 0, "misses": 0, "evictions": 0, "bytes": 0}
+
+        def discard(key: Any) -> None:
+            _, nbytes, _ = entries.pop(key)
+            stats["bytes"] -= nbytes
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = _hashable({k: v for k, v in bound.arguments.items() if k != "timeout"})
+            now = time.monotonic()
+
+            with lock:
+                entry = entries.get(key)
+                if entry is not None and entry[0] > now:
+                    entries.move_to_end(key)
+                    stats["hits"] += 1
+                else:
+                    if entry is not None:
+                        discard(key)
+                    entry = None
+                    stats["misses"] += 1
+            if entry is not None:
+                return entry[2] if mode == "freeze" else copy.deepcopy(entry[2])
+
+            value = func(*args, **kwargs)
+            value = convert.to_frozen(value) if mode == "freeze" else copy.deepcopy(value)
+            nbytes = _sizeof(value)
+
+            with lock:
+                if key in entries:
+                    discard(key)
+                if nbytes <= max_bytes:
+                    entries[key] = (now + ttl, nbytes, value)
+                    stats["bytes"] += nbytes
+                while entries and (len(entries) > maxsize or stats["bytes"] > max_bytes):
+                    discard(next(iter(entries)))
+                    stats["evictions"] += 1
+
+            return value if mode == "freeze" else copy.deepcopy(value)
+
+        def cache_info() -> CacheInfo:
+            with lock:
+                return CacheInfo(
+                    stats["hits"],
+                    stats["misses"],
+                    stats["evictions"],
+                    len(entries),
+                    maxsize,
+                    stats["bytes"],
+                    max_bytes,
+                )
+
+        def cache_clear() -> None:
+            with lock:
+                entries.clear()
+                stats.update(hits=0, misses=0, evictions=0, bytes=0)
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+def _hashable(value: Any) -> Any:
+    """Converts dictionaries and sequences into hashable (and order-insensitive) tuples."""
+
+    if isinstance(value, dict):
+        return tuple(sorted((key, _hashable(val)) for key, val in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(val) for val in value)
+    return value
+
+
+def _sizeof(value: Any) -> int:
+    """Returns an estimate of the memory held by a decoded JSON value in bytes."""
+
+    size = sys.getsizeof(value)
+    if isinstance(value, (dict, MappingProxyType)):
+        return size + sum(_sizeof(key) + _sizeof(val) for key, val in value.items())
+    if isinstance(value, (list, tuple)):
+        return size + sum(_sizeof(val) for val in value)
+    return size
+
+
+def iter_json_items(
+    url: str,
+    path: str = "results.item",
+    params: Optional[dict] = None,
+    timeout: Optional[int] = None,
+    client: Optional[Client] = None,
+    chunk_size: int = 64 * 1024,
+) -> Iterator[Any]:
+    """Streams a JSON response and yields the values found at < path > one at a time as they
+    are parsed, rather than buffering the body and decoding the whole document. Peak memory
+    is bounded by the largest single value plus one chunk.
+
+    The < path > uses dotted notation in which "item" denotes every element of an array, e.g.
+    "item" for a top-level array or "results.item" for the array under the "results" key.
+
+    Parameters:
+        url (str): a url that specifies the resource.
+        path (str): dotted path to the values to yield
+        params (dict): optional dictionary of querystring arguments.
+        timeout (int): timeout value in seconds; defaults to the client timeout
+        client (Client): optional client; defaults to the shared client
+        chunk_size (int): number of bytes read from the response at a time
+
+    Returns:
+        generator: decoded values in document order
+    """
+
+    if client is None:
+        client = get_default_client()
+    with client.get(url, params, timeout=timeout, stream=True) as response:
+        decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")()
+
+        def chunks() -> Iterator[str]:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                yield decoder.decode(chunk)
+            yield decoder.decode(b"", final=True)
+
+        yield from JSONStreamReader(chunks()).items(path)
+
+
+async def async_get_resource(
+    url: str,
+    params: Optional[dict] = None,
+    timeout: Optional[int] = None,
+    client: Optional[Client] = None,
+) -> req.Response:
+    """Awaitable variant of < get_resource >. The blocking request is run in a worker thread
+    so that the event loop remains free to schedule other requests.
+
+    Parameters:
+        url (str): a url that specifies the resource.
+        params (dict): optional dictionary of querystring arguments.
+        timeout (int): timeout value in seconds; defaults to the client timeout
+        client (Client): optional client; defaults to the shared client
+
+    Returns:
+        Response: contains a server response to an HTTP request.
+    """
+
+    if client is None:
+        client = get_default_client()
+    if client.flight is not None:
+        key = client.flight_key(url, params)
+        return await client.flight.do_async(
+            key, asyncio.to_thread, get_resource, url, params, timeout, client
+        )
+    return await asyncio.to_thread(get_resource, url, params, timeout, client)
+
+
+async def async_get_resource_json(
+    url: str,
+    params: Optional[dict] = None,
+    timeout: Optional[int] = None,
+    client: Optional[Client] = None,
+) -> dict | list:
+    """Awaitable variant of < get_resource_json >.
+
+    Parameters:
+        url (str): a url that specifies the resource.
+        params (dict): optional dictionary of querystring arguments.
+        timeout (int): timeout value in seconds; defaults to the client timeout
+        client (Client): optional client; defaults to the shared client
+
+    Returns:
+        dict | list: dictionary or list representation of the decoded JSON.
+    """
+
+    response = await async_get_resource(url, params, timeout, client)
+    return await asyncio.to_thread(response.json)
+
+
+async def gather_json(
+    urls: Sequence[str],
+    params_list: Optional[Sequence[Optional[dict]]] = None,
+    concurrency: int = 10,
+    timeout: Optional[int] = None,
+    client: Optional[Client] = None,
+) -> List[dict | list | Exception]:
+    """Fetches and decodes many JSON resources concurrently. No more than < concurrency >
+    requests are in flight at any one time. Results are returned in input order; a request
+    that fails does not cancel the batch, instead the raised exception is returned in place
+    of its decoded JSON.
+
+    If no < client > is provided a temporary client with a per-host pool sized to
+    < concurrency > is used for the batch.
+
+    Parameters:
+        urls (seq): urls that specify the resources
+        params_list (seq): optional querystring dictionaries, one per url
+        concurrency (int): maximum number of in-flight requests
+        timeout (int): timeout value in seconds; defaults to the client timeout
+        client (Client): optional client
+
+    Returns:
+        list: decoded JSON or exception for each url, in input order
+    """
+
+    if params_list is None:
+        params_list = [None] * len(urls)
+    elif len(params_list) != len(urls):
+        raise ValueError("params_list must be the same length as urls.")
+    if concurrency < 1:
+        raise ValueError("concurrency must be a positive integer.")
+
+    results: List[dict | list | Exception] = [None] * len(urls)  # type: ignore[list-item]
+    pending = iter(range(len(urls)))
+    loop = asyncio.get_running_loop()
+    batch_client = client or Client(pool_maxsize=concurrency)
+
+    async def worker(executor: ThreadPoolExecutor) -> None:
+        for i in pending:
+            try:
+                results[i] = await loop.run_in_executor(
+                    executor, get_resource_json, urls[i], params_list[i], timeout, batch_client
+                )
+            except Exception as err:
+                results[i] = err
+
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            workers = min(concurrency, len(urls))
+            await asyncio.gather(*(worker(executor) for _ in range(workers)))
+    finally:
+        if client is None:
+            batch_client.close()
+
+    return results
+
+
+class Paginator:
+    """Base pagination strategy. A paginator derives the request for the first page and,
+    from each decoded page, the request for the page that follows it.
+    """
+
+    def first_request(self, url: str, params: Optional[dict]) -> Tuple[str, Optional[dict]]:
+        """Returns the url and params of the first page request.
+
+        Parameters:
+            url (str): a url that specifies the resource.
+            params (dict): optional dictionary of querystring arguments.
+
+        Returns:
+            tuple: url and params
+        """
+
+        return url, params
+
+    def next_request(
+        self, url: str, params: Optional[dict], response: req.Response, page: dict | list
+    ) -> Optional[Tuple[str, Optional[dict]]]:
+        """Returns the url and params of the next page request or None after the last page.
+
+        Parameters:
+            url (str): url of the current page request
+            params (dict): params of the current page request
+            response (Response): response of the current page request
+            page (dict | list): decoded current page
+
+        Returns:
+            tuple: url and params or None
+        """
+
+        raise NotImplementedError
+
+
+class NextUrlPaginator(Paginator):
+    """Follows a next page url embedded in the response body (e.g., SWAPI's "next").
+
+    Parameters:
+        key (str): dotted path to the next url in the decoded page
+    """
+
+    def __init__(self, key: str = "next") -> None:
+        self.key = key
+
+    def next_request(self, url, params, response, page):
+        next_url = _lookup(page, self.key)
+        return (next_url, None) if next_url else None
+
+
+class LinkHeaderPaginator(Paginator):
+    """Follows the RFC 8288 Link response header (e.g., GitHub's rel="next").
+
+    Parameters:
+        rel (str): link relation of the next page
+    """
+
+    def __init__(self, rel: str = "next") -> None:
+        self.rel = rel
+
+    def next_request(self, url, params, response, page):
+        next_url = response.links.get(self.rel, {}).get("url")
+        return (next_url, None) if next_url else None
+
+
+class OffsetPaginator(Paginator):
+    """Pages through a resource with offset and limit querystring arguments. Stops after a
+    page returns fewer than < limit > items.
+
+    Parameters:
+        limit (int): number of items requested per page
+        offset_param (str): name of the offset querystring argument
+        limit_param (str): name of the limit querystring argument
+        items_key (str): dotted path to the items list in the decoded page
+        start (int): offset of the first page
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        offset_param: str = "offset",
+        limit_param: str = "limit",
+        items_key: str = "results",
+        start: int = 0,
+    ) -> None:
+        self.limit = limit
+        self.offset_param = offset_param
+        self.limit_param = limit_param
+        self.items_key = items_key
+        self.start = start
+
+    def first_request(self, url, params):
+        return url, {**(params or {}), self.offset_param: self.start, self.limit_param: self.limit}
+
+    def next_request(self, url, params, response, page):
+        items = page if isinstance(page, list) else _lookup(page, self.items_key)
+        if not items or len(items) < self.limit:
+            return None
+        return url, {**params, self.offset_param: int(params[self.offset_param]) + len(items)}
+
+
+class CursorPaginator(Paginator):
+    """Pages through a resource by echoing an opaque cursor returned in each page.
+
+    Parameters:
+        cursor_key (str): dotted path to the next cursor in the decoded page
+        cursor_param (str): name of the cursor querystring argument
+    """
+
+    def __init__(self, cursor_key: str = "next_cursor", cursor_param: str = "cursor") -> None:
+        self.cursor_key = cursor_key
+        self.cursor_param = cursor_param
+
+    def next_request(self, url, params, response, page):
+        cursor = _lookup(page, self.cursor_key)
+        return (url, {**(params or {}), self.cursor_param: cursor}) if cursor else None
+
+
+def iter_pages(
+    url: str,
+    params: Optional[dict] = None,
+    paginator: Optional[Paginator] = None,
+    prefetch: int = 1,
+    timeout: Optional[int] = None,
+    client: Optional[Client] = None,
+) -> Iterator[dict | list]:
+    """Yields the decoded pages of a paginated resource. While the caller processes a page,
+    up to < prefetch > following pages are requested in a background thread, overlapping
+    network latency with processing while holding no more than < prefetch > + 1 pages in
+    memory. Pass < prefetch > = 0 to request each page only when it is needed.
+
+    Parameters:
+        url (str): a url that specifies the first page.
+        params (dict): optional dictionary of querystring arguments.
+        paginator (Paginator): pagination strategy; defaults to < NextUrlPaginator >
+        prefetch (int): number of pages to request ahead of the caller
+        timeout (int): timeout value in seconds; defaults to the client timeout
+        client (Client): optional client; defaults to the shared client
+
+    Returns:
+        generator: decoded pages in order
+    """
+
+    if paginator is None:
+        paginator = NextUrlPaginator()
+    request = paginator.first_request(url, params)
+
+    def fetch(request: Tuple[str, Optional[dict]]) -> tuple:
+        response = get_resource(*request, timeout=timeout, client=client)
+        page = response.json()
+        return page, paginator.next_request(*request, response, page)
+
+    if prefetch < 1:
+        while request is not None:
+            page, request = fetch(request)
+            yield page
+        return
+
+    pages: queue.Queue = queue.Queue()
+    slots = threading.Semaphore(prefetch)
+    stop = threading.Event()
+
+    def produce(request: Optional[Tuple[str, Optional[dict]]]) -> None:
+        try:
+            while request is not None:
+                slots.acquire()
+                if stop.is_set():
+                    return
+                page, request = fetch(request)
+                pages.put((True, page))
+            pages.put((False, None))
+        except BaseException as err:
+            pages.put((False, err))
+
+    producer = threading.Thread(target=produce, args=(request,), daemon=True)
+    producer.start()
+    try:
+        while True:
+            more, page = pages.get()
+            if not more:
+                if page is not None:
+                    raise page
+                return
+            slots.release()
+            yield page
+    finally:
+        stop.set()
+        slots.release()  # wake a producer blocked on a slot
+
+
+def iter_items(
+    url: str,
+    params: Optional[dict] = None,
+    paginator: Optional[Paginator] = None,
+    items_key: str = "results",
+    prefetch: int = 1,
+    timeout: Optional[int] = None,
+    client: Optional[Client] = None,
+) -> Iterator[Any]:
+    """Yields the items of every page of a paginated resource. See < iter_pages >.
+
+    Parameters:
+        url (str): a url that specifies the first page.
+        params (dict): optional dictionary of querystring arguments.
+        paginator (Paginator): pagination strategy; defaults to < NextUrlPaginator >
+        items_key (str): dotted path to the items list in each decoded page (ignored if the
+                         page itself is a list)
+        prefetch (int): number of pages to request ahead of the caller
+        timeout (int): timeout value in seconds; defaults to the client timeout
+        client (Client): optional client; defaults to the shared client
+
+    Returns:
+        generator: items in order
+    """
+
+    for page in iter_pages(url, params, paginator, prefetch, timeout, client):
+        yield from page if isinstance(page, list) else _lookup(page, items_key) or []
+
+
+def _lookup(page: dict | list, path: str) -> Any:
+    """Returns the value at a dotted < path > in a decoded page or None if absent."""
+
+    value = page
+    for key in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
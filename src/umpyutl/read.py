@@ -1,20 +1,122 @@
+import array
+import collections
+import copy
 import csv
+import glob
+import hashlib
+import io
+import itertools
 import json
+import keyword
+import math
+import mmap
+import operator
+import os
 import pathlib
+import pickle
+import re
+import struct
+import sys
+import threading
+import time
 import yaml
-from typing import List, OrderedDict
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    OrderedDict,
+    Sequence,
+    Tuple,
+)
 from warnings import warn
 
+from . import convert
+from ._jsonstream import JSONStreamReader
+
+try:
+    import numpy
+except ImportError:  # optional dependency
+    numpy = None
+
+MemoInfo = namedtuple("MemoInfo", ["hits", "misses", "reloads", "currsize", "maxsize"])
+FOLLOW_FORMATS = ("csv", "jsonl", "txt")
+ROW_TYPES = ("namedtuple", "slots")
+DTYPES = {"int": "q", "float": "d", "str": None}
+YAML_LOADERS = {
+    "full": getattr(yaml, "CFullLoader", yaml.FullLoader),
+    "safe": getattr(yaml, "CSafeLoader", yaml.SafeLoader),
+}
+
+
+def follow(
+    filepath: pathlib.Path | str,
+    format: str = "txt",
+    interval: float = 1.0,
+    timeout: Optional[float] = None,
+    checkpoint: Optional[pathlib.Path | str] = None,
+    encoding: str = "utf-8",
+    delimiter: str = ",",
+    strip: bool = True,
+    as_dicts: bool = False,
+) -> Iterator[Any]:
+    """Follows a file that other processes append to (like tail -F), yielding each complete
+    record as it is written: lines ("txt"), CSV data rows ("csv") or decoded JSON Lines
+    records ("jsonl"). The file is polled every < interval > seconds with an
+    < IncrementalReader >, which handles partially written records, rotation and truncation
+    and, if a < checkpoint > path is provided, resumes where a previous run left off.
+
+    Parameters:
+        filepath (pathlib.Path | str): absolute or relative path to source file
+        format (str): "txt", "csv" or "jsonl"
+        interval (float): seconds to wait between polls when no new records are found
+        timeout (float): stop after this many seconds without new records (None = never)
+        checkpoint (pathlib.Path | str): optional path of the checkpoint file
+        encoding (str): name of an ASCII-compatible encoding used to decode the file
+        delimiter (str): delimiter that separates the row values ("csv")
+        strip (bool): remove white space, newline escape characters ("txt")
+        as_dicts (bool): yield dicts keyed by the header row ("csv")
+
+    Returns:
+        generator: records in the order written
+    """
+
+    with IncrementalReader(
+        filepath, format, encoding, delimiter, strip, as_dicts, checkpoint
+    ) as reader:
+        idle_since = time.monotonic()
+        while True:
+            records = reader.read()
+            if records:
+                yield from records
+                idle_since = time.monotonic()
+            elif timeout is not None and time.monotonic() - idle_since >= timeout:
+                return
+            else:
+                time.sleep(interval)
+
 
 def from_csv(
     filepath: pathlib.Path | str,
     encoding: str = "utf-8",
     newline: str = "",
     delimiter: str = ",",
+    usecols: Optional[Sequence[str | int]] = None,
+    where: Optional[Callable[[Any], bool]] = None,
+    contains: Optional[str | Sequence[str]] = None,
+    cache: Optional["ParseCache"] = None,
 ) -> List[list]:
     """
     Reads a CSV file, parsing row values per the provided delimiter. Returns a list of lists,
-    wherein each nested list represents a single row from the input file.
+    wherein each nested list represents a single row from the input file. Pass < usecols >,
+    < where > and/or < contains > to read a subset of the columns and rows (see < iter_csv >)
+    and a < cache > to reuse the rows parsed by an earlier call (see < ParseCache >).
 
     WARN: If a byte order mark (BOM) is encountered at the beginning of the first line of decoded
     text, call < from_csv > and pass 'utf-8-sig' as the < encoding > argument.
@@ -28,13 +130,180 @@ def from_csv(
         newline (str): specifies replacement value for newline '\n'
                        or '\r\n' (Windows) character sequences
         delimiter (str): delimiter that separates the row values
+        usecols (seq): optional header names or indices of the columns to return
+        where (callable): optional predicate; rows for which it returns False are dropped
+        contains (str | seq): optional raw text prefilter (see < iter_csv >)
+        cache (ParseCache): optional cache of parsed files
 
     Returns:
         list: a list of nested "row" lists
     """
 
+    if cache is not None:
+        if where is not None:
+            raise ValueError("where cannot be combined with cache; filter the cached rows.")
+        return cache.get(
+            filepath,
+            from_csv,
+            encoding=encoding,
+            newline=newline,
+            delimiter=delimiter,
+            usecols=usecols,
+            contains=contains,
+        )
+
+    with open(filepath, "r", encoding=encoding, newline=newline) as file_obj:
+        return [row for row in _select_csv(file_obj, delimiter, usecols, where, contains)]
+
+
+def from_csv_columns(
+    filepath: pathlib.Path | str,
+    dtypes: Optional[Dict[str, str]] = None,
+    encoding: str = "utf-8",
+    newline: str = "",
+    delimiter: str = ",",
+    use_numpy: Optional[bool] = None,
+    batch_size: int = 8192,
+) -> Dict[str, list | array.array]:
+    """Reads a CSV file with a header row directly into columns, returning a dictionary that
+    maps each header value to its column. Rows are parsed in batches that are transposed and
+    converted a column at a time, so no per-row lists or dictionaries are retained. Header
+    values must be unique. Rows with fewer values than the header are padded with empty
+    values; rows with more values than the header raise ValueError.
+
+    Columns listed in < dtypes > as "int" or "float" (or as an < array > typecode such as 'i'
+    or 'f') are stored in compact < array.array > objects, or NumPy arrays that share the
+    same buffer if < use_numpy > is True (default: if NumPy is installed). Numeric strings
+    may include thousand separator commas; an "int" value with a fractional component is
+    truncated as < convert.to_int > does. Empty or invalid values are stored as NaN in float
+    columns and raise ValueError in integer columns. All other columns are lists of interned
+    strings.
+
+    Parameters:
+        filepath (pathlib.Path | str): absolute or relative path to source file
+        dtypes (dict): optional mapping of header value to "int", "float", "str" or typecode
+        encoding (str): name of encoding used to decode the file
+        newline (str): specifies replacement value for newline '\n'
+                       or '\r\n' (Windows) character sequences
+        delimiter (str): delimiter that separates the row values
+        use_numpy (bool): return numeric columns as NumPy arrays
+        batch_size (int): number of rows parsed before they are transposed into columns
+
+    Returns:
+        dict: columns keyed by header value
+    """
+
+    if use_numpy is None:
+        use_numpy = numpy is not None
+    elif use_numpy and numpy is None:
+        raise ImportError("use_numpy=True requires NumPy to be installed.")
+    dtypes = dtypes or {}
+
     with open(filepath, "r", encoding=encoding, newline=newline) as file_obj:
-        return [row for row in csv.reader(file_obj, delimiter=delimiter)]
+        reader = csv.reader(file_obj, delimiter=delimiter)
+        header = next(reader, [])
+        duplicates = sorted({name for name in header if header.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Header contains duplicate column names: {duplicates}")
+        unknown = set(dtypes) - set(header)
+        if unknown:
+            raise ValueError(f"dtypes refers to unknown columns: {sorted(unknown)}")
+
+        typecodes = [DTYPES.get(dtypes.get(name, "str"), dtypes.get(name)) for name in header]
+        invalid = [code for code in typecodes if code and code not in array.typecodes]
+        if invalid:
+            raise ValueError(f"Invalid dtypes {invalid}; use {list(DTYPES)} or array typecodes.")
+        columns = [array.array(code) if code else [] for code in typecodes]
+        width = len(header)
+        line = 1
+        while batch := list(itertools.islice(reader, batch_size)):
+            if min(map(len, batch)) != width or max(map(len, batch)) != width:
+                for offset, row in enumerate(batch):
+                    if len(row) > width:
+                        raise ValueError(
+                            f"Row has {len(row)} values but the header has {width} "
+                            f"(data row {line + offset})."
+                        )
+                batch = [(row + [""] * width)[:width] for row in batch if row]
+            for i, values in enumerate(zip(*batch)):
+                _extend_column(columns[i], values, header[i], line)
+            line += len(batch)
+
+    if use_numpy:
+        columns = [
+            numpy.frombuffer(column, dtype=column.typecode)
+            if isinstance(column, array.array)
+            else column
+            for column in columns
+        ]
+    return dict(zip(header, columns))
+
+
+def _extend_column(column: list | array.array, values: tuple, name: str, line: int) -> None:
+    """Appends a batch of string values to a column, converting numeric values."""
+
+    if isinstance(column, list):
+        column.extend(map(sys.intern, values))
+        return
+
+    is_float = column.typecode in "fd"
+    try:
+        column.extend(array.array(column.typecode, map(float if is_float else int, values)))
+        return
+    except (OverflowError, ValueError):
+        pass
+
+    # Slow path for the batch: thousand separators, fractional ints, empty or invalid values.
+    converted = []
+    for offset, value in enumerate(values):
+        try:
+            number = float(value.replace(",", ""))
+            converted.append(number if is_float else int(number))
+        except (OverflowError, ValueError):  # e.g., "inf" in an integer column
+            if not is_float:
+                raise ValueError(
+                    f"Invalid integer {value!r} in column {name!r} (data row {line + offset}); "
+                    "use a float dtype for columns with missing values."
+                ) from None
+            converted.append(math.nan)
+    column.extend(array.array(column.typecode, converted))
+
+
+def from_csv_parallel(
+    filepath: pathlib.Path | str,
+    workers: Optional[int] = None,
+    chunk_size: int = 16 * 1024 * 1024,
+    encoding: str = "utf-8",
+    delimiter: str = ",",
+    quotechar: str = '"',
+    skip_header: bool = False,
+    map_fn: Optional[Callable[[List[list]], Any]] = None,
+) -> List[list] | list:
+    """Reads a CSV file using a pool of worker processes, returning the same list of "row"
+    lists as < from_csv > (or, if < map_fn > is provided, a list of its per-chunk results).
+    Rows returned without a < map_fn > are pickled back from the workers, which usually makes
+    this slower than < from_csv >; pass a reducing < map_fn > to benefit from the workers. See
+    < iter_csv_parallel >.
+
+    Parameters:
+        filepath (pathlib.Path | str): absolute or relative path to source file
+        workers (int): number of worker processes (default: os.cpu_count())
+        chunk_size (int): approximate number of bytes parsed by each task
+        encoding (str): name of an ASCII-compatible encoding used to decode the file
+        delimiter (str): delimiter that separates the row values
+        quotechar (str): character used to quote fields containing special characters
+        skip_header (bool): omit the first row of the file
+        map_fn (callable): optional picklable function applied to each chunk's rows
+
+    Returns:
+        list: "row" lists or < map_fn > results in file order
+    """
+
+    return list(
+        iter_csv_parallel(
+            filepath, workers, chunk_size, encoding, delimiter, quotechar, skip_header, map_fn
+        )
+    )
 
 
 def from_csv_to_dicts(
@@ -43,10 +312,26 @@ def from_csv_to_dicts(
     newline: str = "",
     delimiter: str = ",",
     ordered: bool = True,
-) -> List[OrderedDict] | List[dict]:
+    row_type: Optional[str] = None,
+    usecols: Optional[Sequence[str | int]] = None,
+    where: Optional[Callable[[Any], bool]] = None,
+    contains: Optional[str | Sequence[str]] = None,
+) -> List[dict] | List[tuple]:
     """Accepts a file path, creates a file object, and returns a list of dictionaries
-    that represent the row values using the cvs.DictReader(). Default type returned
-    in list is an OrderedDict which can be overridden.
+    that represent the row values using the cvs.DictReader(). Each dict preserves the column
+    order of the header row.
+
+    Dicts duplicate the key table for every row. For wide or long files pass a < row_type >
+    to return compact records that share a single generated class per file instead:
+    "namedtuple" (immutable tuple subclass) or "slots" (mutable __slots__ class). Records
+    support dict-like access by header name (e.g., row["name"], row.get(), keys(), items(),
+    to_dict()) as well as attribute access by field name (header names that are not valid
+    identifiers are renamed, see < _fields >). Short rows are padded with None and values
+    beyond the header row are dropped.
+
+    Pass < usecols > to build rows from a subset of the columns only and < where > (called
+    with each projected row) and/or < contains > to drop rows before they are collected (see
+    < iter_csv >).
 
     Parameters:
         filepath (pathlib.Path | str): absolute or relative path to source file
@@ -54,35 +339,147 @@ def from_csv_to_dicts(
         newline (str): specifies replacement value for newline '\n'
                        or '\r\n' (Windows) character sequences
         delimiter (str): delimiter that separates the row values
-        ordered (bool): return either list of OrderedDict objects or dict objects
+        ordered (bool): retained for backwards compatibility; if False each row is copied
+                        into a new dict object
+        row_type (str): optional compact record type; "namedtuple" or "slots"
+        usecols (seq): optional header names or indices of the columns to return
+        where (callable): optional predicate; rows for which it returns False are dropped
+        contains (str | seq): optional raw text prefilter (see < iter_csv >)
 
     Returns:
-        list: nested dictionaries representing the file contents
+        list: nested dictionaries (or records) representing the file contents
     """
 
     with open(filepath, "r", newline=newline, encoding=encoding) as file_obj:
-        if ordered:
-            return [row for row in csv.DictReader(file_obj, delimiter=delimiter)]
+        rows = _select_dicts(file_obj, delimiter, row_type, usecols, where, contains)
+        if ordered or row_type is not None:
+            return [row for row in rows]
         else:
-            return [dict(row) for row in csv.DictReader(file_obj, delimiter=delimiter)]
+            return [dict(row) for row in rows]
+
+
+def from_csv_typed(
+    filepath: pathlib.Path | str,
+    schema: Optional[Dict[str, Any]] = None,
+    sample_rows: int = 100,
+    encoding: str = "utf-8",
+    newline: str = "",
+    delimiter: str = ",",
+    row_type: Optional[str] = None,
+) -> List[dict] | List[tuple]:
+    """Reads a CSV file with a header row into a list of dictionaries (or compact records, see
+    < from_csv_to_dicts >) whose values are converted per < schema > as each row is parsed.
+    The schema is compiled once into a row converter (see < convert.compile_row_converter >)
+    so that typed loading is far faster than calling < convert.to_int > and friends on each
+    value; converted values match those functions. If no schema is provided one is inferred
+    from the first < sample_rows > rows (see < infer_schema >). Blank lines are skipped and
+    values beyond the header row are dropped.
+
+    Parameters:
+        filepath (pathlib.Path | str): absolute or relative path to source file
+        schema (dict): mapping of header value to "int", "float", "str", "list",
+                       ("list", delimiter) or a callable
+        sample_rows (int): number of rows sampled to infer a schema if none is provided
+        encoding (str): name of encoding used to decode the file
+        newline (str): specifies replacement value for newline '\n'
+                       or '\r\n' (Windows) character sequences
+        delimiter (str): delimiter that separates the row values
+        row_type (str): optional compact record type; "namedtuple" or "slots"
+
+    Returns:
+        list: nested dictionaries (or records) of converted values
+    """
+
+    if schema is None:
+        schema = infer_schema(filepath, sample_rows, encoding, newline, delimiter)
+
+    with open(filepath, "r", encoding=encoding, newline=newline) as file_obj:
+        reader = csv.reader(file_obj, delimiter=delimiter)
+        header = next(reader, None)
+        if header is None:
+            return []
+        unknown = set(schema) - set(header)
+        if unknown:
+            raise ValueError(f"schema refers to unknown columns: {sorted(unknown)}")
 
+        convert_row = convert.compile_row_converter(header, schema, as_dict=row_type is None)
+        rows = map(convert_row, filter(None, reader))
+        if row_type is not None:
+            rows = map(make_row_type(header, row_type)._make, rows)
+        return list(rows)
 
-def from_json(filepath: pathlib.Path | str, encoding: str = "utf-8") -> dict | list:
+
+def from_json(
+    filepath: pathlib.Path | str, encoding: str = "utf-8", cache: Optional["ParseCache"] = None
+) -> dict | list:
     """Reads a JSON document, decodes the file content, and returns a list or dictionary if
-    provided with a valid filepath.
+    provided with a valid filepath. Pass a < cache > to reuse the value decoded by an earlier
+    call (see < ParseCache >).
 
     Parameters:
         filepath (pathlib.Path | str): absolute or relative path to source file
         encoding (str): name of encoding used to decode the file
+        cache (ParseCache): optional cache of parsed files
 
     Returns:
         dict | list: dict or list representations of the decoded JSON document
     """
 
+    if cache is not None:
+        return cache.get(filepath, from_json, encoding=encoding)
+
     with open(filepath, "r", encoding=encoding) as file_obj:
         return json.load(file_obj)
 
 
+def from_json_cached(
+    filepath: pathlib.Path | str,
+    encoding: str = "utf-8",
+    mode: str = "freeze",
+    memo: Optional["FileMemo"] = None,
+) -> dict | list:
+    """Returns the decoded JSON document held in process memory, re-reading the file only
+    when its stat signature changes. Intended for config and lookup files read repeatedly
+    (e.g., inside request handlers). By default the document is returned as a shared
+    read-only view; see < FileMemo > for the < mode > options and their cost.
+
+    Parameters:
+        filepath (pathlib.Path | str): absolute or relative path to source file
+        encoding (str): name of encoding used to decode the file
+        mode (str): "freeze" (read-only views) or "copy" (copy-on-read)
+        memo (FileMemo): optional memo; defaults to the shared memo
+
+    Returns:
+        dict | list: dict or list representations of the decoded JSON document
+    """
+
+    if memo is None:
+        memo = get_default_file_memo()
+    return memo.load(filepath, from_json, mode, encoding=encoding)
+
+
+def from_jsonl(
+    filepath: pathlib.Path | str,
+    encoding: str = "utf-8",
+    workers: int = 0,
+    chunk_size: int = 4 * 1024 * 1024,
+) -> list:
+    """Reads a JSON Lines file (one JSON document per line) and returns a list of the decoded
+    records. See < iter_jsonl >.
+
+    Parameters:
+        filepath (pathlib.Path | str): absolute or relative path to source file
+        encoding (str): name of encoding used to decode the file
+        workers (int): number of worker processes (0 = decode in the calling process)
+        chunk_size (int): approximate number of bytes decoded by each worker task
+
+    Returns:
+        list: decoded records
+    """
+
+    return list(iter_jsonl(filepath, encoding, workers, chunk_size))
+
+
 def from_txt(
     filepath: pathlib.Path | str, encoding: str = "utf-8", strip: bool = True
 ) -> List[str]:
@@ -105,18 +502,1616 @@ def from_txt(
             return file_obj.readlines()
 
 
-def from_yaml(filepath: pathlib.Path | str) -> dict | list:
-    """Read a YAML (Yet Another Markup Language) file given a valid filepath.
+def from_yaml(
+    filepath: pathlib.Path | str, loader: str = "full", cache: Optional["ParseCache"] = None
+) -> dict | list:
+    """Read a YAML (Yet Another Markup Language) file given a valid filepath. Pass a < cache >
+    to reuse the value loaded by an earlier call (see < ParseCache >).
+
+    The < loader > is "full" (yaml.FullLoader, which also constructs Python tuples, sets and
+    the like) or "safe" (yaml.SafeLoader, standard YAML tags only, for untrusted input). If
+    PyYAML was built with libyaml the equivalent C loader (CFullLoader or CSafeLoader) is
+    used, which is many times faster on large files. The encoding (UTF-8 or UTF-16) is
+    detected by the YAML parser.
+
+    Parameters:
+        filepath (pathlib.Path | str): absolute or relative path to source file
+        loader (str): "full" or "safe"
+        cache (ParseCache): optional cache of parsed files
+
+    Returns:
+        dict | list: typically a list or dictionary representation of the file object
+    """
+
+    if cache is not None:
+        return cache.get(filepath, from_yaml, loader=loader)
+
+    with open(filepath, "rb") as file_object:
+        return yaml.load(file_object, Loader=_yaml_loader(loader))
+
+
+def from_yaml_cached(
+    filepath: pathlib.Path | str,
+    loader: str = "full",
+    mode: str = "freeze",
+    memo: Optional["FileMemo"] = None,
+) -> dict | list:
+    """Returns the YAML document held in process memory, re-reading the file only when its
+    stat signature changes. See < from_yaml >, < from_json_cached > and < FileMemo >.
 
     Parameters:
         filepath (pathlib.Path | str): absolute or relative path to source file
+        loader (str): "full" or "safe"
+        mode (str): "freeze" (read-only views) or "copy" (copy-on-read)
+        memo (FileMemo): optional memo; defaults to the shared memo
 
     Returns:
         dict | list: typically a list or dictionary representation of the file object
     """
 
-    with open(filepath, "r") as file_object:
-        return yaml.load(file_object, Loader=yaml.FullLoader)
+    if memo is None:
+        memo = get_default_file_memo()
+    return memo.load(filepath, from_yaml, mode, loader=loader)
+
+
+def get_default_file_memo() -> "FileMemo":
+    """Returns the module-level shared < FileMemo >, creating it on first use. The shared
+    memo is used by < from_json_cached > and < from_yaml_cached > when no memo is passed.
+
+    Parameters:
+        None
+
+    Returns:
+        FileMemo: the shared memo
+    """
+
+    global _default_file_memo
+    if _default_file_memo is None:
+        with _default_file_memo_lock:
+            if _default_file_memo is None:
+                _default_file_memo = FileMemo()
+    return _default_file_memo
+
+
+def head_csv(
+    filepath: pathlib.Path | str,
+    n: int = 10,
+    encoding: str = "utf-8",
+    newline: str = "",
+    delimiter: str = ",",
+) -> List[list]:
+    """Returns the header row and the first < n > data rows of a CSV file, reading no
+    further than required.
+
+    Parameters:
+        filepath (pathlib.Path | str): absolute or relative path to source file
+        n (int): number of data rows
+        encoding (str): name of encoding used to decode the file
+        newline (str): specifies replacement value for newline '\n'
+                       or '\r\n' (Windows) character sequences
+        delimiter (str): delimiter that separates the row values
+
+    Returns:
+        list: a list of nested "row" lists
+    """
+
+    with open(filepath, "r", encoding=encoding, newline=newline) as file_obj:
+        return list(itertools.islice(csv.reader(file_obj, delimiter=delimiter), max(n, 0) + 1))
+
+
+def head_txt(
+    filepath: pathlib.Path | str, n: int = 10, encoding: str = "utf-8", strip: bool = True
+) -> List[str]:
+    """Returns the first < n > lines of a text file, reading no further than required.
+
+    Parameters:
+        filepath (pathlib.Path | str): absolute or relative path to source file
+        n (int): number of lines
+        encoding (str): name of encoding used to decode the file.
+        strip (bool): remove white space, newline escape characters
+
+    Returns:
+        list: list of lines
+    """
+
+    with open(filepath, "r", encoding=encoding) as file_obj:
+        lines = itertools.islice(file_obj, max(n, 0))
+        return [line.strip() for line in lines] if strip else list(lines)
+
+
+def infer_schema(
+    filepath: pathlib.Path | str,
+    sample_rows: int = 100,
+    encoding: str = "utf-8",
+    newline: str = "",
+    delimiter: str = ",",
+) -> Dict[str, str]:
+    """Infers a schema for < from_csv_typed > from the first < sample_rows > rows of a CSV
+    file with a header row. A column is typed "int" if every non-empty sampled value is an
+    integer (thousand separator commas allowed), "float" if every such value is a number
+    and "str" otherwise, including columns with no sampled values. Review inferred schemas
+    for columns such as zip codes whose values look numeric but are not.
+
+    Parameters:
+        filepath (pathlib.Path | str): absolute or relative path to source file
+        sample_rows (int): number of data rows to sample
+        encoding (str): name of encoding used to decode the file
+        newline (str): specifies replacement value for newline '\n'
+                       or '\r\n' (Windows) character sequences
+        delimiter (str): delimiter that separates the row values
+
+    Returns:
+        dict: mapping of header value to "int", "float" or "str"
+    """
+
+    with open(filepath, "r", encoding=encoding, newline=newline) as file_obj:
+        reader = csv.reader(file_obj, delimiter=delimiter)
+        header = next(reader, [])
+        sample = list(itertools.islice(reader, sample_rows))
+
+    schema = {}
+    for i, name in enumerate(header):
+        values = [row[i].replace(",", "") for row in sample if i < len(row) and row[i].strip()]
+        schema[name] = _infer_type(values)
+    return schema
+
+
+def _infer_type(values: List[str]) -> str:
+    """Returns the narrowest schema type that converts every value in < values >."""
+
+    if not values:
+        return "str"
+    for name, func in (("int", int), ("float", float)):
+        try:
+            for value in values:
+                func(value)
+        except ValueError:
+            continue
+        return name
+    return "str"
+
+
+def iter_csv(
+    filepath: pathlib.Path | str,
+    encoding: str = "utf-8",
+    newline: str = "",
+    delimiter: str = ",",
+    usecols: Optional[Sequence[str | int]] = None,
+    where: Optional[Callable[[Any], bool]] = None,
+    contains: Optional[str | Sequence[str]] = None,
+) -> Iterator[list]:
+    """Lazily reads a CSV file, yielding one row list at a time rather than materializing
+    every row as < from_csv > does. The file is closed when the generator is exhausted or
+    closed; wrap the generator in < contextlib.closing > if iteration may stop early.
+
+    Unneeded columns and rows can be discarded as they are read. < usecols > limits each
+    row (the header row included) to the named or indexed columns, in the order given; short
+    rows are padded with None and blank lines are skipped. < where > is called with each
+    projected data row and rows for which it returns False are dropped. < contains > (a
+    string or sequence of strings) rejects records whose raw text contains none of the
+    strings before they are parsed, which is far cheaper than parsing every row. The test
+    is case-sensitive and applies to the whole line, so combine it with < where > when a
+    match must fall in a particular column. The header row is always returned.
+
+    Parameters:
+        filepath (pathlib.Path | str): absolute or relative path to source file
+        encoding (str): name of encoding used to decode the file
+        newline (str): specifies replacement value for newline '\n'
+                       or '\r\n' (Windows) character sequences
+        delimiter (str): delimiter that separates the row values
+        usecols (seq): optional header names or indices of the columns to return
+        where (callable): optional predicate; rows for which it returns False are dropped
+        contains (str | seq): optional raw text that a record must contain to be parsed
+
+    Returns:
+        generator: "row" lists
+    """
+
+    with open(filepath, "r", encoding=encoding, newline=newline) as file_obj:
+        yield from _select_csv(file_obj, delimiter, usecols, where, contains)
+
+
+def iter_csv_batches(
+    filepath: pathlib.Path | str,
+    batch_size: int = 1000,
+    encoding: str = "utf-8",
+    newline: str = "",
+    delimiter: str = ",",
+    as_dicts: bool = False,
+    usecols: Optional[Sequence[str | int]] = None,
+    where: Optional[Callable[[Any], bool]] = None,
+    contains: Optional[str | Sequence[str]] = None,
+) -> Iterator[List[list] | List[dict]]:
+    """Lazily reads a CSV file, yielding lists of up to < batch_size > rows (e.g., for bulk
+    inserts). Rows are lists (the header row included) or, if < as_dicts > is True,
+    dictionaries keyed by the header row. The file is closed when the generator is exhausted
+    or closed. Rows dropped by < where > or < contains > (see < iter_csv >) do not count
+    toward the batch size.
+
+    Parameters:
+        filepath (pathlib.Path | str): absolute or relative path to source file
+        batch_size (int): maximum number of rows per batch
+        encoding (str): name of encoding used to decode the file
+        newline (str): specifies replacement value for newline '\n'
+                       or '\r\n' (Windows) character sequences
+        delimiter (str): delimiter that separates the row values
+        as_dicts (bool): yield batches of dict objects rather than lists
+        usecols (seq): optional header names or indices of the columns to return
+        where (callable): optional predicate; rows for which it returns False are dropped
+        contains (str | seq): optional raw text prefilter (see < iter_csv >)
+
+    Returns:
+        generator: lists of rows
+    """
+
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer.")
+
+    with open(filepath, "r", encoding=encoding, newline=newline) as file_obj:
+        if as_dicts:
+            reader = _select_dicts(file_obj, delimiter, None, usecols, where, contains)
+        else:
+            reader = _select_csv(file_obj, delimiter, usecols, where, contains)
+        while batch := list(itertools.islice(reader, batch_size)):
+            yield batch
+
+
+def iter_csv_parallel(
+    filepath: pathlib.Path | str,
+    workers: Optional[int] = None,
+    chunk_size: int = 16 * 1024 * 1024,
+    encoding: str = "utf-8",
+    delimiter: str = ",",
+    quotechar: str = '"',
+    skip_header: bool = False,
+    map_fn: Optional[Callable[[List[list]], Any]] = None,
+) -> Iterator[list] | Iterator[Any]:
+    """Parses a large CSV file on multiple cores. The file is split into byte ranges of
+    roughly < chunk_size > bytes that end on record boundaries, the ranges are parsed by a
+    pool of worker processes and the rows are yielded in file order. At most two ranges per
+    worker are in flight at a time, so memory stays bounded however large the file is.
+
+    Record boundaries are found by quote parity: a newline ends a record only if an even
+    number of < quotechar > characters precede it in the range, so newlines embedded in
+    quoted fields are handled correctly. Files containing unescaped quote characters inside
+    unquoted fields (e.g., 5'10" with the default quotechar) must be read with < iter_csv >.
+    The encoding must be ASCII-compatible (e.g., 'utf-8', 'utf-8-sig' or 'latin-1').
+
+    Without a < map_fn > every parsed row is pickled in the worker and unpickled in the
+    calling process, which often costs more than parsing the file with < iter_csv > in the
+    first place; returning raw rows is rarely faster than < from_csv >. For a speed-up pass a
+    < map_fn > that reduces each chunk (e.g., filters, aggregates or counts its rows). It is
+    called inside the worker with the list of rows parsed from each range and its return
+    value is yielded in place of the rows, so only results cross the process boundary
+    (e.g., map_fn=len counts rows). < map_fn > must be picklable, i.e., a module-level
+    function. Files smaller than < chunk_size > are parsed in-process.
+
+    Parameters:
+        filepath (pathlib.Path | str): absolute or relative path to source file
+        workers (int): number of worker processes (default: os.cpu_count())
+        chunk_size (int): approximate number of bytes parsed by each task
+        encoding (str): name of an ASCII-compatible encoding used to decode the file
+        delimiter (str): delimiter that separates the row values
+        quotechar (str): character used to quote fields containing special characters
+        skip_header (bool): omit the first row of the file
+        map_fn (callable): optional picklable function applied to each chunk's rows
+
+    Returns:
+        generator: "row" lists or, if < map_fn > is provided, one result per chunk
+    """
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+
+    filepath = str(filepath)
+    options = (encoding, delimiter, quotechar, map_fn)
+    ranges = _csv_ranges(filepath, chunk_size, quotechar.encode("utf-8"))
+    head = list(itertools.islice(ranges, 2))
+    if len(head) < 2:
+        for start, end in head:
+            result = _parse_csv_range(filepath, start, end, skip_header, *options)
+            yield from (result if map_fn is None else [result])
+        return
+
+    workers = workers or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pending = collections.deque()
+    try:
+        for i, (start, end) in enumerate(itertools.chain(head, ranges)):
+            pending.append(
+                executor.submit(
+                    _parse_csv_range, filepath, start, end, skip_header and i == 0, *options
+                )
+            )
+            while len(pending) >= 2 * workers or pending and pending[0].done():
+                result = pending.popleft().result()
+                yield from (result if map_fn is None else [result])
+        while pending:
+            result = pending.popleft().result()
+            yield from (result if map_fn is None else [result])
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _csv_ranges(filepath: str, chunk_size: int, quote: bytes) -> Iterator[tuple]:
+    """Yields (start, end) byte ranges of at least < chunk_size > bytes (the last excepted)
+    that begin and end on record boundaries."""
+
+    block_size = min(chunk_size, 1024 * 1024)
+    with open(filepath, "rb") as file_obj:
+        size = os.fstat(file_obj.fileno()).st_size
+        start = 0
+        while size - start > chunk_size:
+            # Count the quotes in the range, then scan on to the first newline at even parity.
+            file_obj.seek(start)
+            quotes, remaining = 0, chunk_size
+            while remaining > 0 and (block := file_obj.read(min(block_size, remaining))):
+                quotes += block.count(quote)
+                remaining -= len(block)
+            pos, end = start + chunk_size, None
+            while end is None and (block := file_obj.read(block_size)):
+                i = 0
+                while (newline := block.find(b"\n", i)) >= 0:
+                    quotes += block.count(quote, i, newline)
+                    i = newline + 1
+                    if not quotes % 2:
+                        end = pos + i
+                        break
+                else:
+                    quotes += block.count(quote, i)
+                pos += len(block)
+            if end is None or end >= size:
+                break
+            yield start, end
+            start = end
+        if start < size:
+            yield start, size
+
+
+def _parse_csv_range(
+    filepath: str,
+    start: int,
+    end: int,
+    skip_header: bool,
+    encoding: str,
+    delimiter: str,
+    quotechar: str,
+    map_fn: Optional[Callable[[List[list]], Any]],
+) -> List[list] | Any:
+    """Parses the rows in a byte range of a CSV file (runs in a worker process)."""
+
+    with open(filepath, "rb") as file_obj:
+        file_obj.seek(start)
+        text = file_obj.read(end - start).decode(encoding)
+    reader = csv.reader(io.StringIO(text, newline=""), delimiter=delimiter, quotechar=quotechar)
+    rows = list(itertools.islice(reader, 1 if skip_header else 0, None))
+    return rows if map_fn is None else map_fn(rows)
+
+
+def iter_csv_to_dicts(
+    filepath: pathlib.Path | str,
+    encoding: str = "utf-8",
+    newline: str = "",
+    delimiter: str = ",",
+    row_type: Optional[str] = None,
+    usecols: Optional[Sequence[str | int]] = None,
+    where: Optional[Callable[[Any], bool]] = None,
+    contains: Optional[str | Sequence[str]] = None,
+) -> Iterator[dict] | Iterator[tuple]:
+    """Lazily reads a CSV file, yielding one dictionary per row keyed by the header row
+    using the csv.DictReader(). The file is closed when the generator is exhausted or closed;
+    wrap the generator in < contextlib.closing > if iteration may stop early.
+
+    Pass a < row_type > ("namedtuple" or "slots") to yield compact records instead of
+    dicts (see < from_csv_to_dicts >) and < usecols >, < where > and/or < contains > to read
+    a subset of the columns and rows (see < iter_csv >).
+
+    Parameters:
+        filepath (pathlib.Path | str): absolute or relative path to source file
+        encoding (str): name of encoding used to decode the file
+        newline (str): specifies replacement value for newline '\n'
+                       or '\r\n' (Windows) character sequences
+        delimiter (str): delimiter that separates the row values
+        row_type (str): optional compact record type; "namedtuple" or "slots"
+        usecols (seq): optional header names or indices of the columns to return
+        where (callable): optional predicate; rows for which it returns False are dropped
+        contains (str | seq): optional raw text prefilter (see < iter_csv >)
+
+    Returns:
+        generator: dictionaries (or records) representing the rows
+    """
+
+    with open(filepath, "r", encoding=encoding, newline=newline) as file_obj:
+        yield from _select_dicts(file_obj, delimiter, row_type, usecols, where, contains)
+
+
+def _select_csv(
+    lines: Iterable[str],
+    delimiter: str,
+    usecols: Optional[Sequence[str | int]] = None,
+    where: Optional[Callable[[list], bool]] = None,
+    contains: Optional[str | Sequence[str]] = None,
+) -> Iterator[list]:
+    """Returns an iterator over the header row and the data rows that pass the < contains >
+    prefilter and the < where > predicate, projected to < usecols >."""
+
+    reader = csv.reader(_prefilter(lines, contains), delimiter=delimiter)
+    if usecols is not None:
+        reader = _project(reader, usecols)
+    if where is None:
+        return reader
+    return itertools.chain(itertools.islice(reader, 1), filter(where, reader))
+
+
+def _select_dicts(
+    lines: Iterable[str],
+    delimiter: str,
+    row_type: Optional[str] = None,
+    usecols: Optional[Sequence[str | int]] = None,
+    where: Optional[Callable[[Any], bool]] = None,
+    contains: Optional[str | Sequence[str]] = None,
+) -> Iterator[dict] | Iterator[tuple]:
+    """Returns an iterator over the dicts (or records) for the data rows that pass the
+    < contains > prefilter and the < where > predicate, projected to < usecols >."""
+
+    if usecols is None and row_type is None:
+        rows = csv.DictReader(_prefilter(lines, contains), delimiter=delimiter)
+    else:
+        rows = _select_csv(lines, delimiter, usecols, None, contains)
+        rows = _iter_records(rows, row_type) if row_type else _iter_dicts(rows)
+    return rows if where is None else filter(where, rows)
+
+
+def _prefilter(lines: Iterable[str], contains: Optional[str | Sequence[str]]) -> Iterable[str]:
+    """Drops the records (after the first) whose raw text contains none of the strings in
+    < contains >. Physical lines are joined into records by quote parity so that quoted
+    fields with embedded newlines are kept or dropped whole."""
+
+    if contains is None:
+        return lines
+    needles = (contains,) if isinstance(contains, str) else tuple(contains)
+    return _prefilter_lines(iter(lines), needles)
+
+
+def _prefilter_lines(lines: Iterator[str], needles: tuple) -> Iterator[str]:
+    header = True
+    for line in lines:
+        if line.count('"') % 2:  # an odd number of quotes continues the record
+            parts = [line]
+            for part in lines:
+                parts.append(part)
+                if part.count('"') % 2:
+                    break
+            line = "".join(parts)
+        if header or any(needle in line for needle in needles):
+            header = False
+            yield line
+
+
+def _project(reader: Iterator[list], usecols: Sequence[str | int]) -> Iterator[list]:
+    """Yields the header row and data rows of a csv.reader() limited to < usecols >."""
+
+    header = next(reader, None)
+    if header is None:
+        return
+    indices = []
+    for column in usecols:
+        if isinstance(column, int) and 0 <= column < len(header):
+            indices.append(column)
+        elif isinstance(column, str) and column in header:
+            indices.append(header.index(column))
+        else:
+            raise ValueError(f"usecols refers to unknown column: {column!r}")
+
+    width = max(indices, default=-1) + 1
+    yield [header[i] for i in indices]
+    for row in reader:
+        if len(row) < width:
+            if not row:
+                continue
+            row += [None] * (width - len(row))
+        yield [row[i] for i in indices]
+
+
+def _iter_dicts(rows: Iterator[list]) -> Iterator[dict]:
+    """Yields a dict per data row keyed by the header row (the first row)."""
+
+    header = next(rows, None)
+    if header is not None:
+        yield from (dict(zip(header, row)) for row in rows)
+
+
+def iter_json_array(
+    filepath: pathlib.Path | str,
+    path: str = "item",
+    encoding: str = "utf-8",
+    chunk_size: int = 1024 * 1024,
+) -> Iterator[Any]:
+    """Lazily reads a JSON document too large to load with < from_json >, yielding the values
+    found at < path > one at a time as the file is read in blocks of < chunk_size >
+    characters. Each value is decoded with json.JSONDecoder.raw_decode(), so peak memory is
+    bounded by the largest single value plus one block and throughput is close to that of
+    json.load(). Values outside < path > are scanned past without being decoded.
+
+    The < path > uses dotted notation in which "item" denotes every element of an array, e.g.
+    "item" for the elements of a top-level array or "results.item" for the elements of the
+    array stored under the "results" key. A malformed document raises json.JSONDecodeError
+    once the parser reaches the error; values before it will already have been yielded.
+
+    Parameters:
+        filepath (pathlib.Path | str): absolute or relative path to source file
+        path (str): dotted path to the values to yield
+        encoding (str): name of encoding used to decode the file
+        chunk_size (int): number of characters read from the file at a time
+
+    Returns:
+        generator: decoded values in document order
+    """
+
+    with open(filepath, "r", encoding=encoding) as file_obj:
+        chunks = iter(lambda: file_obj.read(chunk_size), "")
+        yield from JSONStreamReader(chunks).items(path)
+
+
+def iter_jsonl(
+    filepath: pathlib.Path | str,
+    encoding: str = "utf-8",
+    workers: int = 0,
+    chunk_size: int = 4 * 1024 * 1024,
+) -> Iterator[Any]:
+    """Lazily reads a JSON Lines file (one JSON document per line), yielding one decoded
+    record at a time so that memory use does not grow with the number of records. Blank
+    lines are skipped. A line that cannot be decoded raises json.JSONDecodeError naming the
+    line. The file is closed when the generator is exhausted or closed.
+
+    If < workers > is greater than 0 the file is split into byte ranges of roughly
+    < chunk_size > bytes that end on line boundaries and the ranges are decoded by a pool of
+    worker processes, with at most two ranges per worker in flight. Records are yielded in
+    file order. Decoding in parallel pays off for large files of complex records; for small
+    records the cost of returning them from the workers may exceed the savings.
+
+    Parameters:
+        filepath (pathlib.Path | str): absolute or relative path to source file
+        encoding (str): name of an ASCII-compatible encoding used to decode the file
+        workers (int): number of worker processes (0 = decode in the calling process)
+        chunk_size (int): approximate number of bytes decoded by each worker task
+
+    Returns:
+        generator: decoded records
+    """
+
+    if workers < 1:
+        with open(filepath, "r", encoding=encoding) as file_obj:
+            yield from _decode_jsonl(file_obj, 1)
+        return
+
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+    filepath = str(filepath)
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pending = collections.deque()
+    try:
+        for start, end in _line_ranges(filepath, chunk_size):
+            pending.append(executor.submit(_decode_jsonl_range, filepath, start, end, encoding))
+            while len(pending) >= 2 * workers or pending and pending[0].done():
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _decode_jsonl(lines: Iterable[str], lineno: int, where: str = "") -> Iterator[Any]:
+    """Decodes non-blank lines; < lineno > is the number of the first line."""
+
+    loads = json.loads
+    for lineno, line in enumerate(lines, lineno):
+        if not line or line.isspace():
+            continue
+        try:
+            yield loads(line)
+        except json.JSONDecodeError as err:
+            raise json.JSONDecodeError(f"{err.msg} (line {lineno}{where})", err.doc, err.pos)
+
+
+def _decode_jsonl_range(filepath: str, start: int, end: int, encoding: str) -> list:
+    """Decodes the lines in a byte range of a JSON Lines file (runs in a worker process)."""
+
+    with open(filepath, "rb") as file_obj:
+        file_obj.seek(start)
+        text = file_obj.read(end - start).decode(encoding)
+    where = f" of the byte range starting at {start}"
+    return list(_decode_jsonl(text.split("\n"), 1, where))
+
+
+def _line_ranges(filepath: str, chunk_size: int) -> Iterator[tuple]:
+    """Yields (start, end) byte ranges of roughly < chunk_size > bytes that end on a line
+    boundary."""
+
+    with open(filepath, "rb") as file_obj:
+        size = os.fstat(file_obj.fileno()).st_size
+        start = 0
+        while start < size:
+            file_obj.seek(start + chunk_size)
+            file_obj.readline()
+            end = min(file_obj.tell(), size)
+            yield start, end
+            start = end
+
+
+def iter_yaml_documents(filepath: pathlib.Path | str, loader: str = "full") -> Iterator[Any]:
+    """Lazily reads a multi-document YAML file (documents separated by ---), yielding one
+    document at a time as it is parsed so that only the current document is held in memory.
+    See < from_yaml > for the < loader > options. The file is closed when the generator is
+    exhausted or closed.
+
+    Parameters:
+        filepath (pathlib.Path | str): absolute or relative path to source file
+        loader (str): "full" or "safe"
+
+    Returns:
+        generator: YAML documents
+    """
+
+    Loader = _yaml_loader(loader)
+    with open(filepath, "rb") as file_object:
+        yield from yaml.load_all(file_object, Loader=Loader)
+
+
+def _yaml_loader(loader: str) -> type:
+    """Returns the fastest available YAML loader class for a loader name."""
+
+    try:
+        return YAML_LOADERS[loader]
+    except KeyError:
+        raise ValueError(f"loader must be one of {tuple(YAML_LOADERS)}.") from None
+
+
+def make_row_type(fieldnames: Sequence[str], row_type: str = "slots", name: str = "Row") -> type:
+    """Generates a compact record class for rows with the given header. Instances hold their
+    values in a tuple ("namedtuple") or in __slots__ ("slots") rather than a per-row dict and
+    support both attribute access by field name and dict-like access by header name.
+
+    Parameters:
+        fieldnames (seq): header row values
+        row_type (str): "namedtuple" or "slots"
+        name (str): class name
+
+    Returns:
+        type: record class; build instances with < cls._make(values) >
+    """
+
+    if row_type not in ROW_TYPES:
+        raise ValueError(f"row_type must be one of {ROW_TYPES}.")
+
+    headers = tuple(fieldnames)
+    fields = _field_names(headers)
+    namespace = {
+        "__slots__": (),
+        "_headers": headers,
+        "_index": {header: i for i, header in enumerate(headers)},
+    }
+    if row_type == "namedtuple":
+        return type(name, (_TupleRow, namedtuple(name, fields)), namespace)
+
+    args = ", ".join(fields)
+    body = "".join(f"    self.{field} = {field}\n" for field in fields) or "    pass\n"
+    code = f"def __init__(self, {args}):\n{body}" if fields else f"def __init__(self):\n{body}"
+    exec(code, namespace)  # generated __init__ assigns each slot without a loop
+    namespace.update(
+        __slots__=fields,
+        _fields=fields,
+        _values=operator.attrgetter(*fields) if len(fields) > 1 else _single_value(fields),
+    )
+    return type(name, (_SlotsRow,), namespace)
+
+
+class _RowMixin:
+    """Dict-like access by header name shared by generated record classes."""
+
+    __slots__ = ()
+    _headers: tuple = ()
+    _index: dict = {}
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except (KeyError, IndexError):
+            return default
+
+    def keys(self) -> list:
+        return list(self._headers)
+
+    def items(self) -> list:
+        return list(zip(self._headers, self.values()))
+
+    def to_dict(self) -> dict:
+        return dict(zip(self._headers, self.values()))
+
+
+class _TupleRow(_RowMixin):
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return tuple.__getitem__(self, self._index[key])
+        return tuple.__getitem__(self, key)
+
+    def values(self) -> list:
+        return list(self)
+
+
+class _SlotsRow(_RowMixin):
+    __slots__ = ()
+    _fields: tuple = ()
+
+    @classmethod
+    def _make(cls, values: Iterable) -> "_SlotsRow":
+        return cls(*values)
+
+    def __getitem__(self, key):
+        field = self._fields[self._index[key] if isinstance(key, str) else key]
+        return getattr(self, field)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.values())
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.values() == other.values()
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{field}={value!r}" for field, value in zip(self._fields, self))
+        return f"{type(self).__name__}({values})"
+
+    def values(self) -> list:
+        values = self._values(self)
+        return list(values) if isinstance(values, tuple) else [values]
+
+
+def _field_names(headers: Sequence[str]) -> tuple:
+    """Converts header values into unique, valid identifiers for use as field names."""
+
+    fields, seen = [], set()
+    for i, header in enumerate(headers):
+        field = re.sub(r"\W", "_", str(header)).strip("_")
+        if (
+            not field
+            or field[0].isdigit()
+            or keyword.iskeyword(field)
+            or field in ("self", "_make", "get", "items", "keys", "values", "to_dict")
+            or field in seen
+        ):
+            field, suffix = f"field_{i}", 0
+            while field in seen:  # e.g., headers ["field_1", "1"]
+                suffix += 1
+                field = f"field_{i}_{suffix}"
+        seen.add(field)
+        fields.append(field)
+    return tuple(fields)
+
+
+def _iter_records(reader: Iterator[list], row_type: str) -> Iterator[tuple]:
+    """Yields compact records built from a csv.reader(); the first row is the header."""
+
+    header = next(reader, None)
+    if header is None:
+        return
+    make = make_row_type(header, row_type)._make
+    width = len(header)
+    for row in reader:
+        if len(row) == width:
+            yield make(row)
+        elif row:  # skip blank lines as csv.DictReader() does
+            yield make((row + [None] * width)[:width])
+
+
+def _single_value(fields: tuple):
+    """Returns a getter for a record with zero or one field."""
+
+    if fields:
+        return operator.attrgetter(fields[0])
+    return lambda row: ()
+
+
+class FileMemo:
+    """Thread-safe, in-memory LRU memo of parsed files validated by stat signature. A cached
+    result is returned until the file's device, inode, size, mtime or ctime changes (e.g., an
+    edit or an atomic replace), after which the file is parsed again. Concurrent callers that
+    miss on the same file wait for a single load rather than parsing it in parallel. At most
+    < maxsize > files are held; the least recently used are evicted.
+
+    Cached results are protected from caller mutation. In "freeze" mode (the default) the
+    result is stored and returned as a read-only view (see < convert.to_frozen >): dicts
+    become mapping proxies and lists become tuples, and a hit costs only the stat call. In
+    "copy" mode each caller receives a mutable deep copy; a hit then costs a copy.deepcopy of
+    the whole value, which for large documents is several times slower than parsing the file
+    again, so use it only for small files that callers must modify.
+
+    Parameters:
+        maxsize (int): maximum number of cached files
+    """
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict = collections.OrderedDict()  # key -> (signature, value)
+        self._loading: dict = {}  # key -> lock held while the file is loaded
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "reloads": 0}
+
+    def load(
+        self, filepath: pathlib.Path | str, parse: Callable, mode: str = "freeze", **options
+    ) -> Any:
+        """Returns the cached result of < parse >(filepath, **options) if the file is
+        unchanged; otherwise calls < parse > and caches its result.
+
+        Parameters:
+            filepath (pathlib.Path | str): absolute or relative path to source file
+            parse (callable): parser called when the file is not cached or has changed
+            mode (str): "freeze" (read-only views) or "copy" (copy-on-read)
+            options: keyword arguments passed to < parse >
+
+        Returns:
+            any: parsed content
+        """
+
+        if mode not in ("copy", "freeze"):
+            raise ValueError("mode must be 'copy' or 'freeze'.")
+
+        path = os.path.realpath(filepath)
+        parser = f"{parse.__module__}.{parse.__qualname__}"
+        key = (path, parser, mode, tuple(sorted(options.items())))
+        stat = os.stat(path)
+        signature = (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns)
+
+        with self._lock:
+            entry = self._hit(key, signature)
+            if entry is None:
+                loading = self._loading.setdefault(key, threading.Lock())
+        if entry is None:
+            with loading:
+                with self._lock:  # another caller may have loaded the file meanwhile
+                    entry = self._hit(key, signature)
+                if entry is None:
+                    try:
+                        value = parse(path, **options)
+                        value = convert.to_frozen(value) if mode == "freeze" else value
+                    except BaseException:
+                        with self._lock:
+                            self._loading.pop(key, None)
+                        raise
+                    entry = (signature, value)
+                    # Publish the entry and release the loading lock together so that a caller
+                    # arriving in between cannot miss and parse the file a second time.
+                    with self._lock:
+                        stale = self._entries.pop(key, None)
+                        self._stats["reloads" if stale else "misses"] += 1
+                        self._entries[key] = entry
+                        while len(self._entries) > self.maxsize:
+                            self._entries.popitem(last=False)
+                        self._loading.pop(key, None)
+
+        return entry[1] if mode == "freeze" else copy.deepcopy(entry[1])
+
+    def cache_info(self) -> MemoInfo:
+        """Returns hit, miss and reload counts and the current size of the memo.
+
+        Parameters:
+            None
+
+        Returns:
+            MemoInfo: memo statistics
+        """
+
+        with self._lock:
+            return MemoInfo(
+                self._stats["hits"],
+                self._stats["misses"],
+                self._stats["reloads"],
+                len(self._entries),
+                self.maxsize,
+            )
+
+    def cache_clear(self) -> None:
+        """Removes every cached file and resets the statistics.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self._stats.update(hits=0, misses=0, reloads=0)
+
+    def _hit(self, key: tuple, signature: tuple) -> Optional[tuple]:
+        """Returns the entry for < key > if its signature matches (call with the lock held)."""
+
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != signature:
+            return None
+        self._entries.move_to_end(key)
+        self._stats["hits"] += 1
+        return entry
+
+
+_default_file_memo: Optional[FileMemo] = None
+_default_file_memo_lock = threading.Lock()
+
+
+class IncrementalReader:
+    """Reads the records appended to a growing file since the previous call, so that polling
+    a log or export costs time proportional to the new data rather than the whole file.
+    Records are lines ("txt", as < from_txt > returns them), CSV data rows ("csv", the
+    header row being remembered from the start of the file) or decoded JSON Lines records
+    ("jsonl"). Blank CSV and JSON Lines records are skipped.
+
+    < read > returns only complete records: a trailing record that lacks its newline (or,
+    for CSV, is inside an open quoted field) is left for a later call. The reader keeps its
+    file open, so when the file is rotated (renamed or deleted and recreated) the rest of
+    the old file is read before following the new file from its start; a file truncated
+    below the current offset is read again from its start.
+
+    If a < checkpoint > path is provided the byte offset, file identity and CSV header are
+    saved there after each read and restored by a new reader, so a restarted process
+    resumes where it left off.
+
+    Parameters:
+        filepath (pathlib.Path | str): absolute or relative path to source file
+        format (str): "txt", "csv" or "jsonl"
+        encoding (str): name of an ASCII-compatible encoding used to decode the file
+        delimiter (str): delimiter that separates the row values ("csv")
+        strip (bool): remove white space, newline escape characters ("txt")
+        as_dicts (bool): return dicts keyed by the header row ("csv")
+        checkpoint (pathlib.Path | str): optional path of the checkpoint file
+        chunk_size (int): maximum number of bytes read per call, unless a single record is
+                          larger
+    """
+
+    def __init__(
+        self,
+        filepath: pathlib.Path | str,
+        format: str = "txt",
+        encoding: str = "utf-8",
+        delimiter: str = ",",
+        strip: bool = True,
+        as_dicts: bool = False,
+        checkpoint: Optional[pathlib.Path | str] = None,
+        chunk_size: int = 8 * 1024 * 1024,
+    ) -> None:
+        if format not in FOLLOW_FORMATS:
+            raise ValueError(f"format must be one of {FOLLOW_FORMATS}.")
+        self.filepath = pathlib.Path(filepath)
+        self.format = format
+        self.encoding = encoding
+        self.delimiter = delimiter
+        self.strip = strip
+        self.as_dicts = as_dicts
+        self.checkpoint = None if checkpoint is None else pathlib.Path(checkpoint)
+        self.chunk_size = chunk_size
+        self.offset = 0
+        self.header: Optional[list] = None
+        self._file: Optional[BinaryIO] = None
+        self._identity: Optional[tuple] = None
+
+    def __enter__(self) -> "IncrementalReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def read(self) -> list:
+        """Returns the complete records appended since the previous call (an empty list if
+        there are none or the file does not exist yet).
+
+        Parameters:
+            None
+
+        Returns:
+            list: new records
+        """
+
+        if self._file is None and not self._open():
+            return []
+
+        start = (self._identity, self.offset)
+        try:
+            stat = os.stat(self.filepath)
+            rotated = (stat.st_dev, stat.st_ino) != self._identity
+        except FileNotFoundError:
+            stat, rotated = None, False  # rotated away; keep reading the old file
+
+        if not rotated and stat is not None and stat.st_size < self.offset:
+            self.offset, self.header = 0, None  # truncated in place
+        records = self._read_records(final=rotated)
+        if rotated:
+            self._file.close()
+            self._file = None
+            self.offset, self.header = 0, None
+            if self._open():
+                records += self._read_records()
+
+        if (self._identity, self.offset) != start:
+            self._save()
+        return records
+
+    def close(self) -> None:
+        """Closes the followed file.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _open(self) -> bool:
+        """Opens the file, restoring the checkpoint if it refers to the same file."""
+
+        try:
+            self._file = open(self.filepath, "rb")
+        except FileNotFoundError:
+            return False
+        stat = os.fstat(self._file.fileno())
+        self._identity = (stat.st_dev, stat.st_ino)
+
+        state = _read_checkpoint(self.checkpoint) if self.checkpoint else None
+        if (
+            state
+            and (state["device"], state["inode"]) == self._identity
+            and state["offset"] <= stat.st_size
+            and self.offset == 0
+        ):
+            self.offset, self.header = state["offset"], state["header"]
+        return True
+
+    def _read_records(self, final: bool = False) -> list:
+        """Reads and decodes the complete records after the current offset. If < final > is
+        True an unterminated trailing record is included."""
+
+        self._file.seek(self.offset)
+        if final:
+            data = self._file.read()
+        else:
+            data = self._file.read(self.chunk_size)
+            end = self._complete(data)
+            while not end and len(data) >= self.chunk_size:  # a record larger than chunk_size
+                more = self._file.read(self.chunk_size)
+                if not more:
+                    break
+                data += more
+                end = self._complete(data)
+            data = data[:end]
+        if not data:
+            return []
+
+        at_start = self.offset == 0
+        self.offset += len(data)
+        if self.format == "txt":
+            lines = io.TextIOWrapper(io.BytesIO(data), encoding=self.encoding)
+            return [line.strip() for line in lines] if self.strip else list(lines)
+
+        text = data.decode(self.encoding)
+        if self.format == "jsonl":
+            where = f" after byte offset {self.offset - len(data)}"
+            return list(_decode_jsonl(text.split("\n"), 1, where))
+
+        reader = csv.reader(io.StringIO(text, newline=""), delimiter=self.delimiter)
+        rows = [row for row in reader if row]
+        if self.header is None and at_start and rows:
+            self.header = rows.pop(0)
+        if self.as_dicts:
+            header = self.header or []
+            width = len(header)
+            return [dict(zip(header, row + [None] * (width - len(row)))) for row in rows]
+        return rows
+
+    def _complete(self, data: bytes) -> int:
+        """Returns the length of the complete records at the start of < data >."""
+
+        if self.format != "csv" or b'"' not in data:
+            return data.rfind(b"\n") + 1
+        end = start = quotes = 0
+        while (newline := data.find(b"\n", start)) >= 0:
+            quotes += data.count(b'"', start, newline)
+            start = newline + 1
+            if not quotes % 2:  # a newline inside a quoted field does not end the record
+                end = start
+        return end
+
+    def _save(self) -> None:
+        """Atomically writes the checkpoint file."""
+
+        if self.checkpoint is None or self._identity is None:
+            return
+        state = {
+            "path": str(self.filepath),
+            "device": self._identity[0],
+            "inode": self._identity[1],
+            "offset": self.offset,
+            "header": self.header,
+        }
+        tmp_path = self.checkpoint.with_name(f"{self.checkpoint.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as file_obj:
+            json.dump(state, file_obj)
+        os.replace(tmp_path, self.checkpoint)
+
+
+def _read_checkpoint(checkpoint: pathlib.Path) -> Optional[dict]:
+    """Returns the saved reader state or None if absent or unreadable."""
+
+    try:
+        with open(checkpoint, "r", encoding="utf-8") as file_obj:
+            return json.load(file_obj)
+    except (OSError, ValueError):
+        return None
+
+
+class LineIndex:
+    """Random access to the lines of a large text or CSV file without reading it into memory.
+    The file is memory-mapped and a single scan records the byte offset of each line in a
+    compact array('Q') (8 bytes per line), so < index[i] >, slices and < len(index) > only
+    decode the lines requested. Line numbers are zero-based and, for files with LF or CRLF
+    line endings, match the list returned by < from_txt > (or < from_csv >, the header being
+    row 0). Lines are split on LF only, so a lone CR (which < from_txt > also treats as a line
+    ending) is kept within its line.
+
+    The offsets are saved to a hidden .<filename>.lineindex sidecar file (silently skipped if
+    the directory is not writable) and reused while the source file's size and mtime (ns)
+    are unchanged; otherwise the index is rebuilt. The index reflects the file as it was
+    when the LineIndex was created. The encoding must be ASCII-compatible (e.g., 'utf-8').
+
+    Parameters:
+        filepath (pathlib.Path | str): absolute or relative path to source file
+        encoding (str): name of encoding used to decode the lines
+        strip (bool): remove white space, newline escape characters
+        persist (bool): save and reuse the offsets sidecar file
+    """
+
+    BLOCK_SIZE = 1024 * 1024
+    MAGIC = b"ULIX"
+    HEADER = struct.Struct("<4sQQ")  # magic, source size, source mtime_ns
+
+    def __init__(
+        self,
+        filepath: pathlib.Path | str,
+        encoding: str = "utf-8",
+        strip: bool = True,
+        persist: bool = True,
+    ) -> None:
+        self.filepath = pathlib.Path(filepath)
+        self.index_path = self.filepath.with_name(f".{self.filepath.name}.lineindex")
+        self.encoding = encoding
+        self.strip = strip
+        with open(self.filepath, "rb") as file_obj:
+            stat = os.fstat(file_obj.fileno())
+            self._header = self.HEADER.pack(self.MAGIC, stat.st_size, stat.st_mtime_ns)
+            self._map = b""  # an empty file cannot be mapped
+            if stat.st_size:
+                self._map = mmap.mmap(file_obj.fileno(), 0, access=mmap.ACCESS_READ)
+            self.offsets = self._load() if persist else None
+            if self.offsets is None:
+                self.offsets = self._scan(file_obj)
+                if persist:
+                    self._save()
+
+    def __enter__(self) -> "LineIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, key: int | slice) -> str | List[str]:
+        if isinstance(key, slice):
+            return [self._line(i) for i in range(*key.indices(len(self)))]
+        return self._line(self._position(key))
+
+    def __iter__(self) -> Iterator[str]:
+        return (self._line(i) for i in range(len(self)))
+
+    def close(self) -> None:
+        """Releases the memory map.
+
+        Parameters:
+            None
+
+        Returns:
+            None
+        """
+
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+
+    def row(self, i: int, delimiter: str = ",") -> list:
+        """Returns line < i > parsed as a CSV row. Rows must not contain quoted newlines.
+
+        Parameters:
+            i (int): zero-based line number (0 = header row)
+            delimiter (str): delimiter that separates the row values
+
+        Returns:
+            list: row values
+        """
+
+        line = self._raw(self._position(i)).decode(self.encoding)
+        return next(csv.reader([line], delimiter=delimiter), [])
+
+    def rows(self, start: int = 0, stop: Optional[int] = None, delimiter: str = ",") -> List[list]:
+        """Returns lines < start > to < stop > (exclusive) parsed as CSV rows. Rows must not
+        contain quoted newlines.
+
+        Parameters:
+            start (int): zero-based line number of the first row (0 = header row)
+            stop (int): line number after the last row (default: end of file)
+            delimiter (str): delimiter that separates the row values
+
+        Returns:
+            list: a list of nested "row" lists
+        """
+
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if start >= stop:
+            return []
+        text = self._map[self.offsets[start] : self.offsets[stop]].decode(self.encoding)
+        return list(csv.reader(io.StringIO(text, newline=""), delimiter=delimiter))
+
+    def _position(self, i: int) -> int:
+        """Returns the non-negative line number for < i >."""
+
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("line index out of range")
+        return i
+
+    def _raw(self, i: int) -> bytes:
+        """Returns the bytes of line < i > including its line ending."""
+
+        return self._map[self.offsets[i] : self.offsets[i + 1]]
+
+    def _line(self, i: int) -> str:
+        """Returns line < i > decoded (and stripped) as < from_txt > would."""
+
+        line = self._raw(i).decode(self.encoding)
+        if self.strip:
+            return line.strip()
+        return line[:-2] + "\n" if line.endswith("\r\n") else line
+
+    def _scan(self, file_obj: BinaryIO) -> array.array:
+        """Returns the offset of each line start plus the file size, read in blocks."""
+
+        offsets = array.array("Q", [0])
+        position = 0
+        while block := file_obj.read(self.BLOCK_SIZE):
+            # Each newline ends a line; the next line starts one byte after it.
+            lengths = itertools.accumulate(map(len, block.split(b"\n")[:-1]))
+            offsets.extend(map(operator.add, lengths, itertools.count(position + 1)))
+            position += len(block)
+        if offsets[-1] != position:  # last line lacks a trailing newline
+            offsets.append(position)
+        return offsets
+
+    def _load(self) -> Optional[array.array]:
+        """Returns the offsets saved in the sidecar file if it matches the source file."""
+
+        try:
+            with open(self.index_path, "rb") as file_obj:
+                if file_obj.read(self.HEADER.size) != self._header:
+                    return None
+                offsets = array.array("Q", file_obj.read())
+        except (OSError, ValueError):
+            return None
+        if sys.byteorder == "big":
+            offsets.byteswap()
+        return offsets if offsets and offsets[-1] == len(self._map) else None
+
+    def _save(self) -> None:
+        """Atomically writes the offsets to the sidecar file."""
+
+        offsets = array.array("Q", self.offsets)
+        if sys.byteorder == "big":
+            offsets.byteswap()
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, "wb") as file_obj:
+                file_obj.write(self._header)
+                offsets.tofile(file_obj)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+
+class ParseCache:
+    """Persistent cache of parsed file contents. The value returned by a parser (e.g.,
+    < from_csv >, < from_json >, < from_yaml >) is written to a binary pickle snapshot that is
+    loaded instead of re-parsing the file on later calls. Loading a snapshot is typically
+    faster than parsing CSV and orders of magnitude faster than parsing YAML; the gain for
+    JSON, whose decoder is already fast, is small.
+
+    Snapshots are keyed by the resolved source path, parser and parser options, and record
+    the source file's size and modification time (ns). A snapshot is used only if these
+    still match the source file, otherwise the file is re-parsed and the snapshot replaced;
+    a snapshot is not written if the file changes while it is parsed. Snapshots are written
+    atomically so concurrent readers never see a partial snapshot.
+
+    If < directory > is None snapshots are written next to each source file as hidden
+    .<filename>.<key>.parsecache sidecar files (silently skipped if the source directory is
+    not writable). Otherwise snapshots are stored in < directory > and, when their total
+    size exceeds < max_bytes >, the least recently used are evicted. Values whose snapshot
+    exceeds < max_bytes > are never stored.
+
+    WARN: snapshots are unpickled on load; never point a ParseCache at a directory that
+    untrusted users can write to.
+
+    Parameters:
+        directory (pathlib.Path | str): optional cache directory (created if it does not exist)
+        max_bytes (int): maximum total size of snapshots in < directory > in bytes
+    """
+
+    FORMAT = 1
+
+    def __init__(
+        self, directory: Optional[pathlib.Path | str] = None, max_bytes: int = 1024 * 1024 * 1024
+    ) -> None:
+        self.directory = None
+        if directory is not None:
+            self.directory = pathlib.Path(directory).expanduser()
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(filepath: pathlib.Path | str, options: dict) -> str:
+        """Returns the cache key for a source file and its parser options.
+
+        Parameters:
+            filepath (pathlib.Path | str): absolute or relative path to source file
+            options (dict): parser name and options
+
+        Returns:
+            str: hex digest identifying the snapshot
+        """
+
+        payload = json.dumps([os.path.realpath(filepath), options], sort_keys=True, default=repr)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, filepath: pathlib.Path | str, parse: Callable, **options) -> Any:
+        """Returns the parsed content of < filepath >, loading the snapshot if it is current
+        and otherwise calling < parse >(filepath, **options) and storing the result.
+
+        Parameters:
+            filepath (pathlib.Path | str): absolute or relative path to source file
+            parse (callable): parser called on a cache miss
+            options: keyword arguments passed to < parse >
+
+        Returns:
+            any: parsed content
+        """
+
+        filepath = pathlib.Path(filepath)
+        key_options = {"parser": f"{parse.__module__}.{parse.__qualname__}", **options}
+        snapshot = self.path(filepath, key_options)
+        header = self._header(filepath, key_options)
+
+        try:
+            with open(snapshot, "rb") as file_obj:
+                if pickle.load(file_obj) == header:
+                    value = pickle.load(file_obj)
+                    if self.directory is not None:
+                        os.utime(snapshot)  # mark as recently used
+                    return value
+        except FileNotFoundError:
+            pass
+        except Exception:  # truncated or incompatible snapshot
+            snapshot.unlink(missing_ok=True)
+
+        value = parse(filepath, **options)
+        if self._header(filepath, key_options) == header:
+            self._store(snapshot, header, value)
+        return value
+
+    def path(self, filepath: pathlib.Path | str, options: dict) -> pathlib.Path:
+        """Returns the snapshot path for a source file and its parser options.
+
+        Parameters:
+            filepath (pathlib.Path | str): absolute or relative path to source file
+            options (dict): parser name and options
+
+        Returns:
+            pathlib.Path: snapshot path
+        """
+
+        key = self.key(filepath, options)
+        if self.directory is not None:
+            return self.directory.joinpath(f"{key}.parsecache")
+        filepath = pathlib.Path(filepath)
+        return filepath.with_name(f".{filepath.name}.{key[:16]}.parsecache")
+
+    def clear(self, filepath: Optional[pathlib.Path | str] = None) -> None:
+        """Removes the snapshots of < filepath > or, if no filepath is provided, every
+        snapshot in the cache directory.
+
+        Parameters:
+            filepath (pathlib.Path | str): optional source file
+
+        Returns:
+            None
+        """
+
+        if self.directory is None:
+            if filepath is None:
+                raise ValueError("filepath is required to clear sidecar snapshots.")
+            filepath = pathlib.Path(filepath)
+            snapshots = filepath.parent.glob(f".{glob.escape(filepath.name)}.*.parsecache")
+        else:
+            snapshots = self.directory.glob("*.parsecache")
+
+        with self._lock:
+            for snapshot in snapshots:
+                if filepath is not None and self.directory is not None:
+                    try:
+                        with open(snapshot, "rb") as file_obj:
+                            source = pickle.load(file_obj)["path"]
+                    except Exception:
+                        source = None
+                    if source != os.path.realpath(filepath):
+                        continue
+                snapshot.unlink(missing_ok=True)
+
+    def _header(self, filepath: pathlib.Path, options: dict) -> dict:
+        """Returns the snapshot header that validates a snapshot against its source."""
+
+        stat = filepath.stat()
+        return {
+            "format": self.FORMAT,
+            "path": os.path.realpath(filepath),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "options": options,
+        }
+
+    def _store(self, snapshot: pathlib.Path, header: dict, value: Any) -> None:
+        """Atomically writes a snapshot unless it exceeds < max_bytes >."""
+
+        tmp_name = f"{snapshot.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        tmp_path = snapshot.with_name(tmp_name)
+        try:
+            with open(tmp_path, "wb") as file_obj:
+                pickle.dump(header, file_obj, pickle.HIGHEST_PROTOCOL)
+                pickle.dump(value, file_obj, pickle.HIGHEST_PROTOCOL)
+                size = file_obj.tell()
+            if size > self.max_bytes:
+                tmp_path.unlink()
+                return
+            os.replace(tmp_path, snapshot)
+        except (OSError, pickle.PicklingError, TypeError):
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        if self.directory is not None:
+            with self._lock:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Deletes least recently used snapshots until the cache is within < max_bytes >."""
+
+        entries = []
+        for path in self.directory.glob("*.parsecache"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        entries.sort()
+        size = sum(size for _, size, _ in entries)
+        for _, entry_size, path in entries:
+            if size <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            size -= entry_size
+
+
+def tail_csv(
+    filepath: pathlib.Path | str,
+    n: int = 10,
+    encoding: str = "utf-8",
+    newline: str = "",
+    delimiter: str = ",",
+    block_size: int = 64 * 1024,
+) -> List[list]:
+    """Returns the header row and the last < n > data rows of a CSV file. The rows are read
+    backward from the end of the file (see < tail_txt >), so the time taken depends on < n >
+    rather than the file size. Data rows must not contain quoted newlines.
+
+    Parameters:
+        filepath (pathlib.Path | str): absolute or relative path to source file
+        n (int): number of data rows
+        encoding (str): name of an ASCII-compatible encoding used to decode the file
+        newline (str): specifies replacement value for newline '\n'
+                       or '\r\n' (Windows) character sequences
+        delimiter (str): delimiter that separates the row values
+        block_size (int): number of bytes read at a time
+
+    Returns:
+        list: a list of nested "row" lists
+    """
+
+    header = head_csv(filepath, 0, encoding, newline, delimiter)
+    data, at_start = _tail_bytes(filepath, max(n, 0), block_size)
+    text = io.TextIOWrapper(io.BytesIO(data), encoding=encoding, newline=newline)
+    rows = list(csv.reader(text, delimiter=delimiter))
+    return header + (rows[1:] if at_start else rows)
+
+
+def tail_txt(
+    filepath: pathlib.Path | str,
+    n: int = 10,
+    encoding: str = "utf-8",
+    strip: bool = True,
+    block_size: int = 64 * 1024,
+) -> List[str]:
+    """Returns the last < n > lines of a text file, equivalent to from_txt(filepath)[-n:] for
+    files with LF or CRLF line endings. Blocks of < block_size > bytes are read backward from
+    the end of the file until < n > LF-terminated lines have been found, so the time taken
+    depends on < n > rather than the file size. Lines are counted on LF only, so the result
+    may differ from < from_txt > for a file that also uses lone CR line endings.
+
+    Parameters:
+        filepath (pathlib.Path | str): absolute or relative path to source file
+        n (int): number of lines
+        encoding (str): name of an ASCII-compatible encoding used to decode the file
+        strip (bool): remove white space, newline escape characters
+        block_size (int): number of bytes read at a time
+
+    Returns:
+        list: list of lines
+    """
+
+    data, _ = _tail_bytes(filepath, max(n, 0), block_size)
+    lines = io.TextIOWrapper(io.BytesIO(data), encoding=encoding)
+    return [line.strip() for line in lines] if strip else list(lines)
+
+
+def _tail_bytes(filepath: pathlib.Path | str, n: int, block_size: int) -> Tuple[bytes, bool]:
+    """Returns the bytes of the last < n > lines of a file and whether they start at the
+    beginning of the file."""
+
+    if n == 0:
+        return b"", False
+    with open(filepath, "rb") as file_obj:
+        position = end = file_obj.seek(0, os.SEEK_END)
+        blocks, newlines = [], 0
+        while position > 0 and newlines < n:
+            size = min(block_size, position)
+            position -= size
+            file_obj.seek(position)
+            block = file_obj.read(size)
+            newlines += block.count(b"\n")
+            if position + size == end and block.endswith(b"\n"):
+                newlines -= 1  # the final newline ends the last line rather than adding one
+            blocks.append(block)
+    data = b"".join(reversed(blocks))
+
+    cut = len(data) - 1
+    for _ in range(n):
+        cut = data.rfind(b"\n", 0, cut)
+        if cut < 0:
+            return data, True
+    return data[cut + 1 :], False
 
 
 def read_csv(
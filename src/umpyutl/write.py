@@ -1,10 +1,45 @@
 import csv
+import hashlib
+import itertools
 import json
+import os
 import pathlib
+import re
 import requests
-from typing import List, Optional, Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, List, Optional, Tuple
 from warnings import warn
 
+from . import http
+
+
+def append_jsonl(
+    filepath: pathlib.Path | str,
+    data: Iterable[Any],
+    encoding: str = "utf-8",
+    ensure_ascii: bool = False,
+    batch_size: int = 1000,
+) -> int:
+    """Appends records to a JSON Lines file (see < to_jsonl >) without rewriting the existing
+    content. If the file does not end with a newline (e.g., an earlier write was interrupted)
+    one is added first so that the new records start on a line of their own.
+
+    Parameters:
+        filepath (pathlib.Path | str): path to target file (if file does not exist it will be created)
+        data (iterable): records to be encoded as JSON, one per line
+        encoding (str): name of encoding used to encode the file
+        ensure_ascii (bool): if False non-ASCII characters are printed as is; otherwise
+                             non-ASCII characters are escaped.
+        batch_size (int): number of records encoded per write
+
+    Returns:
+        int: number of records written
+    """
+
+    return _write_jsonl(filepath, data, "a", encoding, ensure_ascii, batch_size)
+
 
 def dicts_to_csv(
     filepath: pathlib.Path | str,
@@ -42,6 +77,148 @@ def dicts_to_csv(
         writer.writerows(data)
 
 
+def download(
+    url: str,
+    filepath: pathlib.Path | str,
+    parts: int = 4,
+    chunk_size: int = 1024 * 1024,
+    timeout: int = 10,
+    client: Optional[http.Client] = None,
+) -> None:
+    """Downloads the resource at < url > to a target file. If the server supports byte range
+    requests the resource is split into < parts > ranges that are fetched in parallel and
+    written into a preallocated file. Progress is recorded in a sidecar journal
+    (< filepath >.download.json) so that a failed or interrupted download resumes where each
+    range left off on the next call; the journal is removed once the download completes. If
+    the server does not support range requests the resource is streamed to the file with
+    < to_file_response_chunked >.
+
+    Parameters:
+        url (str): a url that specifies the resource.
+        filepath (pathlib.Path | str): path to target file (if file does not exist it will be created)
+        parts (int): number of byte ranges fetched in parallel
+        chunk_size (int): size of data chunks to stream
+        timeout (int): timeout value in seconds
+        client (http.Client): optional client; defaults to the shared client
+
+    Returns:
+        None
+    """
+
+    if client is None:
+        client = http.get_default_client()
+    filepath = pathlib.Path(filepath)
+    journal_path = filepath.with_name(f"{filepath.name}.download.json")
+
+    # Probe range support with a one-byte range request. A server that ignores the Range
+    # header answers 200 OK with the full body, which is then streamed to the file.
+    probe = client.get(url, timeout=timeout, headers={"Range": "bytes=0-0"}, stream=True)
+    match = re.fullmatch(r"bytes 0-0/(\d+)", probe.headers.get("Content-Range", ""))
+    if probe.status_code != 206 or match is None or parts < 2:
+        if probe.status_code != 200:
+            probe.close()
+            probe = client.get(url, timeout=timeout, stream=True)
+        probe.raise_for_status()
+        with probe:
+            to_file_response_chunked(filepath, probe, "wb", chunk_size)
+        journal_path.unlink(missing_ok=True)
+        return
+    probe.close()
+
+    size = int(match.group(1))
+    etag = probe.headers.get("ETag", "")
+    validator = etag if etag and not etag.startswith("W/") else probe.headers.get("Last-Modified")
+    journal = _read_journal(journal_path)
+    if not (
+        journal
+        and journal["url"] == url
+        and journal["size"] == size
+        and journal["validator"] == validator
+        and filepath.exists()
+        and filepath.stat().st_size == size
+    ):
+        part_size = -(-size // parts)  # ceiling division
+        journal = {
+            "url": url,
+            "size": size,
+            "validator": validator,
+            "ranges": [
+                [start, min(start + part_size, size)] for start in range(0, size, part_size)
+            ],
+        }
+        with open(filepath, "wb") as file_obj:
+            file_obj.truncate(size)  # preallocate
+        _write_journal(journal_path, journal)
+
+    lock = threading.Lock()
+    failed = threading.Event()
+    last_saved = [time.monotonic()]
+
+    def fetch(i: int) -> None:
+        start, end = journal["ranges"][i]  # [next offset, end offset)
+        if start >= end:
+            return
+        headers = {"Range": f"bytes={start}-{end - 1}"}
+        if validator:
+            headers["If-Range"] = validator
+        with client.get(url, timeout=timeout, headers=headers, stream=True) as response:
+            if response.status_code != 206:
+                raise requests.HTTPError(
+                    f"Expected 206 Partial Content for range {start}-{end - 1}, "
+                    f"got {response.status_code}.",
+                    response=response,
+                )
+            with open(filepath, "r+b", buffering=0) as file_obj:
+                file_obj.seek(start)
+                for chunk in _stream_to_file(response, file_obj, chunk_size, limit=end - start):
+                    if failed.is_set():
+                        return
+                    start += len(chunk)
+                    with lock:
+                        journal["ranges"][i][0] = start
+                        if time.monotonic() - last_saved[0] > 0.5:
+                            _write_journal(journal_path, journal)
+                            last_saved[0] = time.monotonic()
+        if start < end:
+            raise requests.ConnectionError(f"Range {start}-{end - 1} ended prematurely.")
+
+    def run(i: int) -> None:
+        try:
+            fetch(i)
+        except BaseException:
+            failed.set()  # stop the other ranges; progress is kept in the journal
+            raise
+
+    with ThreadPoolExecutor(max_workers=len(journal["ranges"])) as executor:
+        futures = [executor.submit(run, i) for i in range(len(journal["ranges"]))]
+        errors = [future.exception() for future in futures if future.exception()]
+
+    if errors:
+        with lock:
+            _write_journal(journal_path, journal)
+        raise errors[0]
+    journal_path.unlink(missing_ok=True)
+
+
+def _read_journal(journal_path: pathlib.Path) -> Optional[dict]:
+    """Returns the download progress journal or None if absent or unreadable."""
+
+    try:
+        with open(journal_path, "r", encoding="utf-8") as file_obj:
+            return json.load(file_obj)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_journal(journal_path: pathlib.Path, journal: dict) -> None:
+    """Atomically writes the download progress journal."""
+
+    tmp_path = journal_path.with_name(f"{journal_path.name}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as file_obj:
+        json.dump(journal, file_obj)
+    os.replace(tmp_path, journal_path)
+
+
 def to_csv(
     filepath: pathlib.Path | str,
     data: list | tuple,
@@ -84,27 +261,114 @@ def to_csv(
 def to_file_response_chunked(
     filepath: pathlib.Path | str,
     response: requests.Response,
-    mode: str = "w",
-    chunk_size: int = 1024,
-) -> None:
-    """Writes < requests.Response > to a target file as a stream of data chunks.
-    Override the optional write mode value if binary content <class 'bytes'> is to
-    be written to file (i.e., mode='wb') or an append operation is intended on an
-    existing file (i.e., mode='a' or 'ab').
+    mode: str = "wb",
+    chunk_size: int = 64 * 1024,
+    max_chunk_size: int = 8 * 1024 * 1024,
+    digest: Optional[str] = None,
+    progress: Optional[Callable[[int, Optional[int], float], None]] = None,
+) -> Optional[str]:
+    """Writes < requests.Response > to a target file as a stream of raw bytes. Pass a
+    streamed response (i.e., < stream=True >) to avoid buffering the body in memory. The
+    read size starts at < chunk_size > and doubles (up to < max_chunk_size >) while the
+    connection delivers full chunks faster than they are written. Override the optional write
+    mode value if an append operation is intended on an existing file (i.e., mode='ab'); text
+    modes (e.g., 'w', 'a') are written as binary.
+
+    If a < digest > algorithm name (e.g., 'sha256', 'md5') is provided the hex digest of the
+    content is computed as it is written. If a < progress > callable is provided it is called
+    after each chunk with the number of bytes written, the expected total (None if unknown)
+    and the throughput in bytes per second.
 
     Parameters:
         filepath (pathlib.Path | str): absolute or relative path to target file
         response (requests.Response): data to be written to the target file
         mode (str): write operation mode
-        chunk_size (int); size of data chunks to stream
+        chunk_size (int): initial size of data chunks to stream
+        max_chunk_size (int): maximum size of data chunks to stream
+        digest (str): optional hashlib algorithm name
+        progress (callable): optional progress callback
 
     Returns:
-        None
+        str | None: hex digest of the content if < digest > is provided; otherwise None
     """
 
-    with open(filepath, mode) as file_object:
-        for chunk in response.iter_content(chunk_size=chunk_size):
-            file_object.write(chunk)
+    if "b" not in mode:
+        mode = f"{mode.replace('t', '')}b"
+    hasher = hashlib.new(digest) if digest else None
+    total = None
+    if progress and "Content-Encoding" not in response.headers:
+        try:
+            total = int(response.headers.get("Content-Length", 0)) or None
+        except ValueError:  # malformed or comma-joined header
+            total = None
+
+    written = 0
+    start = time.perf_counter()
+    with open(filepath, mode, buffering=0) as file_obj:
+        for chunk in _stream_to_file(response, file_obj, chunk_size, max_chunk_size):
+            written += len(chunk)
+            if hasher:
+                hasher.update(chunk)
+            if progress:
+                progress(written, total, written / max(time.perf_counter() - start, 1e-9))
+
+    return hasher.hexdigest() if hasher else None
+
+
+def _stream_to_file(
+    response: requests.Response,
+    file_obj: BinaryIO,
+    chunk_size: int,
+    max_chunk_size: Optional[int] = None,
+    limit: Optional[int] = None,
+) -> Iterator[bytes]:
+    """Copies the response body to an unbuffered binary file object, yielding each chunk once
+    written. A streamed body is read from the urllib3 response in chunks that start at
+    < chunk_size > and double (up to < max_chunk_size >) while full chunks arrive quickly, so
+    fast connections are copied with fewer, larger reads. A body that has already been read
+    (e.g., not streamed or served from a cache) is copied via < iter_content >. At most
+    < limit > bytes are written if a limit is provided."""
+
+    max_chunk_size = max_chunk_size or chunk_size
+    raw = response.raw
+    if hasattr(raw, "stream"):  # urllib3 response, as checked by iter_content
+        size, streamed = chunk_size, False
+        while limit is None or limit > 0:
+            if limit is not None:
+                size = min(size, limit)
+            start = time.perf_counter()
+            chunk = raw.read(size, decode_content=True)  # undo any Content-Encoding
+            if not chunk:
+                break
+            streamed = True
+            _write_all(file_obj, chunk)
+            yield chunk
+            if limit is not None:
+                limit -= len(chunk)
+            if len(chunk) == size < max_chunk_size and time.perf_counter() - start < 0.01:
+                size = min(size * 2, max_chunk_size)
+        else:
+            return
+        if streamed:
+            return
+
+    # Body already read (e.g., not streamed or served from a cache).
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        if limit is not None:
+            chunk = chunk[:limit]
+            limit -= len(chunk)
+        _write_all(file_obj, chunk)
+        yield chunk
+        if limit is not None and limit <= 0:
+            return
+
+
+def _write_all(file_obj: BinaryIO, data: bytes) -> None:
+    """Writes every byte of < data > to an unbuffered file object."""
+
+    view = memoryview(data)
+    while view:
+        view = view[file_obj.write(view) :]
 
 
 def to_json(
@@ -132,6 +396,61 @@ def to_json(
         json.dump(data, file_obj, ensure_ascii=ensure_ascii, indent=indent)
 
 
+def to_jsonl(
+    filepath: pathlib.Path | str,
+    data: Iterable[Any],
+    encoding: str = "utf-8",
+    ensure_ascii: bool = False,
+    batch_size: int = 1000,
+) -> int:
+    """Serializes records as JSON Lines (one compact JSON document per line) and writes them
+    to the provided filepath. < data > may be any iterable, including a generator; records
+    are encoded and written < batch_size > at a time so memory use does not grow with the
+    number of records. Read the file back with < read.iter_jsonl >.
+
+    Parameters:
+        filepath (pathlib.Path | str): path to target file (if file does not exist it will be created)
+        data (iterable): records to be encoded as JSON, one per line
+        encoding (str): name of encoding used to encode the file
+        ensure_ascii (bool): if False non-ASCII characters are printed as is; otherwise
+                             non-ASCII characters are escaped.
+        batch_size (int): number of records encoded per write
+
+    Returns:
+        int: number of records written
+    """
+
+    return _write_jsonl(filepath, data, "w", encoding, ensure_ascii, batch_size)
+
+
+def _write_jsonl(
+    filepath: pathlib.Path | str,
+    data: Iterable[Any],
+    mode: str,
+    encoding: str,
+    ensure_ascii: bool,
+    batch_size: int,
+) -> int:
+    """Writes records as JSON Lines in batches; see < to_jsonl >."""
+
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer.")
+
+    encode = json.JSONEncoder(ensure_ascii=ensure_ascii, separators=(",", ":")).encode
+    records = iter(data)
+    count = 0
+    with open(filepath, mode, encoding=encoding, newline="\n") as file_obj:
+        if mode == "a" and file_obj.tell() > 0:
+            with open(filepath, "rb") as tail:
+                tail.seek(-1, os.SEEK_END)
+                if tail.read(1) != b"\n":
+                    file_obj.write("\n")
+        while batch := list(itertools.islice(records, batch_size)):
+            file_obj.write("\n".join(map(encode, batch)) + "\n")
+            count += len(batch)
+    return count
+
+
 def to_txt(
     filepath: pathlib.Path | str,
     data: List[str] | Tuple[str],
@@ -0,0 +1,123 @@
+"""Local stand-in HTTP server used by the http and write module tests."""
+
+import json
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+class StandInServer:
+    """Threaded HTTP/1.1 server bound to an ephemeral localhost port. Routes map a path to a
+    callable that accepts the request handler and returns a (status, headers, body) tuple.
+    Bodies that are not bytes or str are encoded as JSON.
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def url(self, path):
+        return f"{self.base_url}{path}"
+
+    def route(self, path, func):
+        self.routes[path] = func
+
+    def hits(self, path):
+        with self._lock:
+            return sum(1 for request in self.requests if request["path"] == path)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def log_message(self, *args):
+                pass
+
+            @property
+            def query(self):
+                return {k: v[-1] for k, v in parse_qs(urlsplit(self.path).query).items()}
+
+            def do_HEAD(self):
+                self._dispatch(send_body=False)
+
+            def do_GET(self):
+                self._dispatch()
+
+            def _dispatch(self, send_body=True):
+                path = urlsplit(self.path).path
+                with server._lock:
+                    server.requests.append(
+                        {"method": self.command, "path": path, "headers": dict(self.headers)}
+                    )
+                func = server.routes.get(path)
+                if func is None:
+                    status, headers, body = 404, {}, {"detail": "Not found"}
+                else:
+                    status, headers, body = func(self)
+                if isinstance(body, str):
+                    body = body.encode("utf-8")
+                elif not isinstance(body, bytes):
+                    body = json.dumps(body).encode("utf-8")
+                    headers = {"Content-Type": "application/json", **headers}
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, str(value))
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if send_body and status != 304:
+                    self.wfile.write(body)
+
+        return Handler
+
+
+def serve_bytes(data, ranges=True, etag='"v1"'):
+    """Returns a route that serves < data >, honoring single byte Range requests if
+    < ranges > is True."""
+
+    def route(request):
+        headers = {"Content-Type": "application/octet-stream", "ETag": etag}
+        header = request.headers.get("Range")
+        if not ranges:
+            return 200, headers, data
+        headers["Accept-Ranges"] = "bytes"
+        if header is None:
+            return 200, headers, data
+        start, _, end = header.removeprefix("bytes=").partition("-")
+        start, end = int(start), min(int(end or len(data) - 1), len(data) - 1)
+        headers["Content-Range"] = f"bytes {start}-{end}/{len(data)}"
+        return 206, headers, data[start : end + 1]
+
+    return route
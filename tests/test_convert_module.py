@@ -164,6 +164,79 @@ class UmpyUtlConvertTest(unittest.TestCase):
                 """,
             )
 
+    def test_10_to_frozen(self):
+        """to_frozen nested dict"""
+
+        try:
+            getattr(convert, "to_frozen")
+        except AttributeError:
+            raise AttributeError("< convert.to_frozen > function not found.")
+        else:
+            droid = convert.to_frozen({"name": "R2-D2", "films": ["A New Hope"]})
+            self.assertEqual(
+                droid["films"],
+                ("A New Hope",),
+                """\nError: calling < convert.to_frozen > did not convert the nested list to a
+                tuple.
+                """,
+            )
+            with self.assertRaises(TypeError):
+                droid["name"] = "C-3PO"
+
+    def test_11_compile_row_converter(self):
+        """compile_row_converter schema"""
+
+        try:
+            getattr(convert, "compile_row_converter")
+        except AttributeError:
+            raise AttributeError("< convert.compile_row_converter > function not found.")
+        else:
+            convert_row = convert.compile_row_converter(
+                ["name", "diameter", "gravity", "terrain", "films"],
+                {
+                    "diameter": "int",
+                    "gravity": "float",
+                    "terrain": ("list", ", "),
+                    "films": "list",
+                },
+            )
+            self.assertEqual(
+                convert_row(["Tatooine", "10,465", "1", "Desert, Canyons", "IV VI"]),
+                {
+                    "name": "Tatooine",
+                    "diameter": 10465,
+                    "gravity": 1.0,
+                    "terrain": ["Desert", "Canyons"],
+                    "films": ["IV", "VI"],
+                },
+                """\nError: calling the compiled converter did not return the expected typed
+                values.
+                """,
+            )
+            self.assertEqual(
+                convert_row(["Hoth", "unknown", "1.1"]),
+                {
+                    "name": "Hoth",
+                    "diameter": "unknown",
+                    "gravity": 1.1,
+                    "terrain": None,
+                    "films": None,
+                },
+                """\nError: calling the compiled converter did not fall back to the < to_* >
+                functions for unconvertible and missing values.
+                """,
+            )
+            convert_row = convert.compile_row_converter(["a", "b"], {"a": "int", "b": "int"})
+            self.assertEqual(
+                [convert_row(["9007199254740993", "1"]), convert_row(["9007199254740993", ""])],
+                [{"a": 9007199254740993, "b": 1}, {"a": 9007199254740993, "b": ""}],
+                """\nError: a value was converted differently depending on the other values in
+                its row.
+                """,
+            )
+            with self.assertRaises(ValueError):
+                convert.compile_row_converter(["name"], {"name": "bool"})
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -1,7 +1,13 @@
+import asyncio
+import inspect
 import requests
+import tempfile
+import threading
+import time
 import unittest
 
 from src.umpyutl import http
+from tests.server import StandInServer
 
 # project_path = Path.cwd().parent
 # if project_path not in sys.path:
@@ -11,6 +17,17 @@ from src.umpyutl import http
 class UmpyUtlHttpTest(unittest.TestCase):
     """umpyutl functional tests."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Start local stand-in server."""
+        cls.server = StandInServer()
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop local stand-in server."""
+        cls.server.stop()
+
     def setUp(self):
         """Default values."""
         self.base_url = "https://swapi.py4e.com/api"
@@ -190,6 +207,405 @@ class UmpyUtlHttpTest(unittest.TestCase):
             "Error: decoded response does not match fixture response.",
         )
 
+    def test_05_client_connection_reuse(self):
+        """http.Client pooled connection test"""
+
+        self.server.route("/droids/", lambda request: (200, {}, {"name": "R2-D2"}))
+        connections = self.server.connections
+
+        with http.Client(pool_maxsize=2, headers={"X-Api-Key": "wookiee"}) as client:
+            for _ in range(5):
+                droid = http.get_resource_json(self.server.url("/droids/"), client=client)
+                self.assertEqual(droid, {"name": "R2-D2"}, "Error: unexpected droid.")
+
+        self.assertEqual(
+            self.server.connections - connections, 1, "Error: connection was not reused."
+        )
+        self.assertEqual(
+            self.server.requests[-1]["headers"].get("X-Api-Key"),
+            "wookiee",
+            "Error: default header not sent.",
+        )
+
+        def slow(request):
+            time.sleep(0.5)
+            return 200, {}, {"name": "C-3PO"}
+
+        self.server.route("/slow/", slow)
+        with http.Client(timeout=0.1) as client:
+            with self.assertRaises(requests.Timeout):  # the client timeout applies
+                http.get_resource(self.server.url("/slow/"), client=client)
+
+    def test_06_default_client(self):
+        """http.get_default_client test"""
+
+        self.server.route("/planets/", lambda request: (200, {}, request.query))
+        client = http.Client()
+        http.set_default_client(client)
+        try:
+            self.assertIs(http.get_default_client(), client, "Error: default client not set.")
+            response = http.get_resource(self.server.url("/planets/"), {"search": "hoth"})
+            self.assertIsInstance(response, requests.Response, "Error: not a Response.")
+            self.assertEqual(response.json(), {"search": "hoth"}, "Error: params not sent.")
+        finally:
+            http.set_default_client(None)
+
+        # The shared client reuses connections but keeps no cookie state between callers
+        self.server.route("/login/", lambda request: (200, {"Set-Cookie": "sid=1; Path=/"}, {}))
+        self.server.route("/me/", lambda request: (200, {}, {"cookie": request.headers["Cookie"]}))
+        try:
+            http.get_resource(self.server.url("/login/"))
+            self.assertEqual(
+                http.get_resource_json(self.server.url("/me/")),
+                {"cookie": None},
+                "Error: shared client stored a cookie.",
+            )
+            with http.Client() as client:
+                client.get(self.server.url("/login/"))
+                self.assertEqual(
+                    client.get(self.server.url("/me/")).json(),
+                    {"cookie": "sid=1"},
+                    "Error: client cookie not sent.",
+                )
+        finally:
+            http.set_default_client(None)
+
+    def test_07_async_get_resource_json(self):
+        """http.async_get_resource_json test"""
+
+        self.server.route("/films/", lambda request: (200, {}, request.query))
+        film = asyncio.run(
+            http.async_get_resource_json(self.server.url("/films/"), {"episode_id": "4"})
+        )
+        self.assertEqual(film, {"episode_id": "4"}, "Error: decoded response does not match.")
+
+    def test_08_gather_json(self):
+        """http.gather_json bounded concurrency test"""
+
+        lock = threading.Lock()
+        in_flight = {"now": 0, "max": 0}
+
+        def species(request):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            time.sleep(0.02)
+            with lock:
+                in_flight["now"] -= 1
+            if request.query["id"] == "3":
+                return 500, {"Content-Type": "text/html"}, "<h1>Server Error</h1>"
+            return 200, {}, {"id": int(request.query["id"])}
+
+        self.server.route("/species/", species)
+        urls = [self.server.url("/species/")] * 12
+        params_list = [{"id": str(i)} for i in range(12)]
+
+        results = asyncio.run(http.gather_json(urls, params_list, concurrency=4))
+
+        self.assertEqual(len(results), 12, "Error: unexpected number of results.")
+        self.assertIsInstance(results[3], Exception, "Error: failure not reported in place.")
+        self.assertEqual(
+            [result["id"] for i, result in enumerate(results) if i != 3],
+            [i for i in range(12) if i != 3],
+            "Error: results not returned in input order.",
+        )
+        self.assertLessEqual(in_flight["max"], 4, "Error: concurrency limit exceeded.")
+
+    def test_09_response_cache_revalidation(self):
+        """http.ResponseCache conditional request test"""
+
+        def vehicle(request):
+            if request.headers.get("If-None-Match") == '"v1"':
+                return 304, {"ETag": '"v1"'}, b""
+            return 200, {"ETag": '"v1"'}, {"name": "Sand Crawler"}
+
+        self.server.route("/vehicles/4/", vehicle)
+        url = self.server.url("/vehicles/4/")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with http.Client(cache=http.ResponseCache(tmp_dir)) as client:
+                first = http.get_resource_json(url, client=client)
+                response = http.get_resource(url, client=client)
+
+        self.assertEqual(self.server.hits("/vehicles/4/"), 2, "Error: expected 2 requests.")
+        self.assertEqual(
+            self.server.requests[-1]["headers"].get("If-None-Match"),
+            '"v1"',
+            "Error: conditional request not sent.",
+        )
+        self.assertTrue(getattr(response, "from_cache", False), "Error: not served from disk.")
+        self.assertEqual(response.json(), first, "Error: cached body does not match.")
+
+    def test_10_response_cache_max_age_eviction(self):
+        """http.ResponseCache max-age and LRU eviction test"""
+
+        def starship(request):
+            body = {"id": request.query["id"], "pad": "x" * 100}
+            return 200, {"Cache-Control": "max-age=60"}, body
+
+        self.server.route("/starships/", starship)
+        url = self.server.url("/starships/")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cache = http.ResponseCache(tmp_dir, max_bytes=300)
+            with http.Client(cache=cache) as client:
+                for starship_id in ("1", "1", "2", "3"):
+                    http.get_resource_json(url, {"id": starship_id}, client=client)
+                    time.sleep(0.01)
+
+            self.assertEqual(self.server.hits("/starships/"), 3, "Error: fresh entry refetched.")
+            self.assertIsNone(cache.lookup(url, {"id": "1"}), "Error: LRU entry not evicted.")
+            self.assertIsNotNone(cache.lookup(url, {"id": "3"}), "Error: entry not cached.")
+
+    def test_11_memoize(self):
+        """http.memoize TTL/LRU test"""
+
+        self.server.route("/people/", lambda request: (200, {}, {"names": [request.query["q"]]}))
+        url = self.server.url("/people/")
+        get_json = http.memoize(maxsize=2, ttl=60)(http.get_resource_json)
+        hits = self.server.hits("/people/")
+
+        people = get_json(url, {"q": "Leia"})
+        people["names"].append("Vader")  # caller mutation must not leak into the cache
+        self.assertEqual(get_json(url, params={"q": "Leia"}), {"names": ["Leia"]})
+        get_json(url, {"q": "Luke"})
+        get_json(url, {"q": "Han"})  # evicts Leia
+
+        info = get_json.cache_info()
+        self.assertEqual(self.server.hits("/people/") - hits, 3, "Error: cached call refetched.")
+        self.assertEqual((info.hits, info.misses, info.evictions), (1, 3, 1))
+        self.assertEqual(
+            inspect.signature(get_json),
+            inspect.signature(http.get_resource_json),
+            "Error: signature changed.",
+        )
+
+        frozen = http.memoize(ttl=0.05, mode="freeze")(http.get_resource_json)
+        people = frozen(url, {"q": "Rey"})
+        self.assertIs(frozen(url, {"q": "Rey"}), people, "Error: frozen view not shared.")
+        with self.assertRaises(TypeError):
+            people["names"] = []
+        time.sleep(0.06)
+        self.assertIsNot(frozen(url, {"q": "Rey"}), people, "Error: expired entry served.")
+
+    def test_12_coalesce_threads(self):
+        """http.Client coalesce threaded test"""
+
+        release = threading.Event()
+
+        def film(request):
+            release.wait(5)
+            return 200, {}, {"title": "The Empire Strikes Back"}
+
+        self.server.route("/films/5/", film)
+        url = self.server.url("/films/5/")
+        results = []
+
+        with http.Client(coalesce=True) as client:
+            threads = [
+                threading.Thread(
+                    target=lambda: results.append(http.get_resource_json(url, client=client))
+                )
+                for _ in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            time.sleep(0.1)
+            release.set()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(self.server.hits("/films/5/"), 1, "Error: requests not coalesced.")
+        self.assertEqual(len(results), 8, "Error: not every caller received the result.")
+
+    def test_13_coalesce_asyncio(self):
+        """http.Client coalesce asyncio test"""
+
+        def film(request):
+            time.sleep(0.1)
+            return 200, {}, {"title": "Return of the Jedi"}
+
+        async def fetch_all(client):
+            url = self.server.url("/films/6/")
+            return await asyncio.gather(
+                *(http.async_get_resource_json(url, client=client) for _ in range(8))
+            )
+
+        self.server.route("/films/6/", film)
+        with http.Client(coalesce=True) as client:
+            films = asyncio.run(fetch_all(client))
+
+        self.assertEqual(self.server.hits("/films/6/"), 1, "Error: requests not coalesced.")
+        self.assertEqual(films, [{"title": "Return of the Jedi"}] * 8)
+
+        flight = http.SingleFlight()
+
+        def fail():
+            raise ValueError("It's a trap!")
+
+        with self.assertRaises(ValueError):
+            flight.do("key", fail)
+
+    def test_14_retry_after(self):
+        """http.Retry with Retry-After test"""
+
+        attempts = {"count": 0}
+
+        def planet(request):
+            attempts["count"] += 1
+            if attempts["count"] < 3:
+                return 429, {"Retry-After": "0.05"}, {"detail": "Too many requests"}
+            return 200, {}, {"name": "Dagobah"}
+
+        self.server.route("/planets/5/", planet)
+        retry = http.Retry(total=3, backoff_factor=10)  # Retry-After takes precedence
+        with http.Client(retry=retry, limiter=http.RateLimiter(rate=100, burst=10)) as client:
+            start = time.monotonic()
+            planet = http.get_resource_json(self.server.url("/planets/5/"), client=client)
+            elapsed = time.monotonic() - start
+            stats = client.stats()
+
+        self.assertEqual(planet, {"name": "Dagobah"}, "Error: request not retried.")
+        self.assertEqual((stats["requests"], stats["retries"]), (3, 2))
+        self.assertGreaterEqual(elapsed, 0.1, "Error: Retry-After not honored.")
+        self.assertLess(elapsed, 5, "Error: backoff used instead of Retry-After.")
+
+    def test_15_rate_limiter(self):
+        """http.RateLimiter token bucket test"""
+
+        self.server.route("/starships/9/", lambda request: (200, {}, {"name": "Death Star"}))
+        with http.Client(limiter=http.RateLimiter(rate=50, burst=2)) as client:
+            start = time.monotonic()
+            for _ in range(7):
+                http.get_resource(self.server.url("/starships/9/"), client=client)
+            elapsed = time.monotonic() - start
+            stats = client.stats()
+
+        self.assertGreaterEqual(elapsed, 0.09, "Error: rate limit not enforced.")
+        self.assertGreater(stats["wait_time"], 0, "Error: wait time not recorded.")
+        self.assertGreater(stats["work_time"], 0, "Error: work time not recorded.")
+
+    def test_16_iter_pages_prefetch(self):
+        """http.iter_pages next url prefetch test"""
+
+        def people(request):
+            page = int(request.query.get("page", "1"))
+            next_url = self.server.url(f"/paged/people/?page={page + 1}") if page < 4 else None
+            return 200, {}, {"next": next_url, "results": [f"person-{page}"]}
+
+        self.server.route("/paged/people/", people)
+        hits = self.server.hits("/paged/people/")
+
+        pages = http.iter_pages(self.server.url("/paged/people/"), prefetch=1)
+        first = next(pages)
+        time.sleep(0.1)
+        self.assertEqual(first["results"], ["person-1"], "Error: unexpected first page.")
+        self.assertEqual(
+            self.server.hits("/paged/people/") - hits, 2, "Error: next page not prefetched."
+        )
+        pages.close()
+
+        people = list(http.iter_items(self.server.url("/paged/people/"), prefetch=2))
+        self.assertEqual(people, [f"person-{page}" for page in range(1, 5)])
+
+    def test_17_iter_items_strategies(self):
+        """http.iter_items Link header, offset and cursor pagination test"""
+
+        planets = [f"planet-{i}" for i in range(7)]
+
+        def linked(request):
+            offset = int(request.query.get("offset", "0"))
+            headers = {}
+            if offset + 3 < len(planets):
+                next_url = self.server.url(f"/linked/planets/?offset={offset + 3}")
+                headers["Link"] = f'<{next_url}>; rel="next"'
+            return 200, headers, planets[offset : offset + 3]
+
+        def offset(request):
+            start, limit = int(request.query["offset"]), int(request.query["limit"])
+            return 200, {}, {"results": planets[start : start + limit]}
+
+        def cursor(request):
+            start = int(request.query.get("cursor", "0"))
+            next_cursor = str(start + 3) if start + 3 < len(planets) else None
+            return 200, {}, {"data": {"items": planets[start : start + 3]}, "cursor": next_cursor}
+
+        self.server.route("/linked/planets/", linked)
+        self.server.route("/offset/planets/", offset)
+        self.server.route("/cursor/planets/", cursor)
+
+        for path, paginator, items_key in (
+            ("/linked/planets/", http.LinkHeaderPaginator(), "results"),
+            ("/offset/planets/", http.OffsetPaginator(limit=3), "results"),
+            ("/cursor/planets/", http.CursorPaginator(cursor_key="cursor"), "data.items"),
+        ):
+            items = list(http.iter_items(self.server.url(path), None, paginator, items_key))
+            self.assertEqual(items, planets, f"Error: {path} items do not match.")
+
+    def test_18_iter_json_items(self):
+        """http.iter_json_items streaming decode test"""
+
+        fxt_results = [
+            {"name": f"Clone {i}", "quote": 'He said "Roger, roger" \\ ]}', "rank": [i, None]}
+            for i in range(500)
+        ]
+        body = {"count": 500, "meta": {"tags": ["a", {"b": "]"}]}, "results": fxt_results}
+        self.server.route("/clones/", lambda request: (200, {}, body))
+
+        clones = http.iter_json_items(self.server.url("/clones/"), chunk_size=7)
+        self.assertEqual(next(clones), fxt_results[0], "Error: first item does not match.")
+        self.assertEqual(list(clones), fxt_results[1:], "Error: items do not match fixture.")
+        self.assertEqual(
+            list(http.iter_json_items(self.server.url("/clones/"), "meta.tags.item")),
+            ["a", {"b": "]"}],
+            "Error: nested path items do not match.",
+        )
+
+        # Numbers split across chunk boundaries (e.g. "-2500." + "0") must not be cut short
+        fxt_numbers = [-2500.0, 1.5, 1e3, -12, 0, 3.25e-7, 123456789, -0.0, 42]
+        self.server.route("/numbers/", lambda request: (200, {}, fxt_numbers))
+        for chunk_size in range(1, 9):
+            self.assertEqual(
+                list(
+                    http.iter_json_items(
+                        self.server.url("/numbers/"), "item", chunk_size=chunk_size
+                    )
+                ),
+                fxt_numbers,
+                f"Error: numbers do not match fixture at chunk_size={chunk_size}.",
+            )
+
+    def test_19_timing_observers(self):
+        """http.Client timing observer and TimingHistogram test"""
+
+        self.server.route("/timed/", lambda request: (200, {}, {"name": "BB-8"}))
+        timings = []
+        histogram = http.TimingHistogram()
+
+        with http.Client(observers=[timings.append, histogram]) as client:
+            for _ in range(3):
+                http.get_resource(self.server.url("/timed/"), client=client)
+
+        host = timings[0].host
+        self.assertEqual(len(timings), 3, "Error: observer not called per request.")
+        self.assertFalse(timings[0].reused, "Error: first connection reported as reused.")
+        self.assertGreater(timings[0].connect, 0, "Error: connect time not recorded.")
+        self.assertTrue(timings[-1].reused, "Error: pooled connection not reported as reused.")
+        self.assertEqual(timings[-1].bytes_received, len(b'{"name": "BB-8"}'))
+        self.assertLessEqual(timings[-1].ttfb, timings[-1].total, "Error: ttfb exceeds total.")
+
+        summary = histogram.summary()[host]
+        self.assertEqual((summary["count"], summary["reused"]), (3, 2))
+        self.assertEqual(sum(count for _, count in histogram.histogram(host, "ttfb")), 3)
+
+        # A comma-joined Content-Length on a streamed response is reported as unknown
+        self.server.route("/joined/", lambda request: (200, {"Content-Length": 6}, b"[1, 2]"))
+        timings.clear()
+        with http.Client(observers=[timings.append]) as client:
+            items = list(http.iter_json_items(self.server.url("/joined/"), "item", client=client))
+        self.assertEqual(items, [1, 2], "Error: items do not match.")
+        self.assertIsNone(timings[-1].bytes_received, "Error: malformed Content-Length parsed.")
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -1,8 +1,17 @@
+import array
+import contextlib
+import csv
+import json
+import math
 import sys
+import tempfile
+import time
+import types
 import unittest
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from src.umpyutl import read
+from src.umpyutl import convert, read
 
 # project_path = Path.cwd().parent
 # if project_path not in sys.path:
@@ -106,6 +115,433 @@ class UmpyUtlReadTest(unittest.TestCase):
             "Error: config['maps']['ann_arbor_mi_1925']['digital_id'] != 'http://hdl.loc.gov/loc.gmd/g4114am.g039091925'",
         )
 
+    def test_11_iter_csv(self):
+        """read.iter_csv test"""
+
+        filepath = self.fixtures_path.joinpath("wookieepedia_planets").with_suffix(".csv")
+        planets = read.iter_csv(filepath)
+        self.assertIsInstance(planets, types.GeneratorType, "Error: planets is not a generator.")
+        self.assertEqual(list(planets), read.from_csv(filepath), "Error: rows do not match.")
+
+        with contextlib.closing(read.iter_csv(filepath)) as planets:
+            self.assertEqual(next(planets)[:2], ["url", "name"], "Error: unexpected header.")
+
+    def test_12_iter_csv_to_dicts(self):
+        """read.iter_csv_to_dicts test"""
+
+        filepath = self.fixtures_path.joinpath("wookieepedia_starships").with_suffix(".csv")
+        starships = list(read.iter_csv_to_dicts(filepath))
+        self.assertEqual(starships, read.from_csv_to_dicts(filepath), "Error: rows do not match.")
+
+    def test_13_iter_csv_batches(self):
+        """read.iter_csv_batches test"""
+
+        filepath = self.fixtures_path.joinpath("wookieepedia_planets").with_suffix(".csv")
+        batches = list(read.iter_csv_batches(filepath, batch_size=7))
+        self.assertEqual([len(batch) for batch in batches], [7, 7, 5], "Error: batch sizes.")
+        self.assertEqual(
+            [row for batch in batches for row in batch],
+            read.from_csv(filepath),
+            "Error: rows do not match.",
+        )
+
+        batches = list(read.iter_csv_batches(filepath, batch_size=10, as_dicts=True))
+        self.assertEqual([len(batch) for batch in batches], [10, 8], "Error: dict batch sizes.")
+        self.assertIsInstance(batches[0][0], dict, "Error: batches[0][0] is not a dict.")
+
+    def test_14_from_csv_to_dicts_row_type(self):
+        """read.from_csv_to_dicts row_type test"""
+
+        filepath = self.fixtures_path.joinpath("wookieepedia_starships").with_suffix(".csv")
+        starships = read.from_csv_to_dicts(filepath)
+
+        for row_type in ("namedtuple", "slots"):
+            records = read.from_csv_to_dicts(filepath, row_type=row_type)
+            self.assertFalse(hasattr(records[0], "__dict__"), "Error: record has a __dict__.")
+            self.assertEqual(records[0]["name"], starships[0]["name"], "Error: item access.")
+            self.assertEqual(records[0].name, starships[0]["name"], "Error: attribute access.")
+            self.assertEqual(
+                [record.to_dict() for record in records],
+                starships,
+                f"Error: {row_type} records do not match dicts.",
+            )
+
+        Row = read.make_row_type(["Vax Level", "class"], "slots")
+        row = Row._make(["Moderate", "A"])
+        self.assertEqual(Row._fields, ("Vax_Level", "field_1"), "Error: fields not renamed.")
+        self.assertEqual(row.items(), [("Vax Level", "Moderate"), ("class", "A")])
+
+        for row_type in ("namedtuple", "slots"):
+            Row = read.make_row_type(["field_1", "1", "field_1_1"], row_type)
+            self.assertEqual(Row._fields, ("field_1", "field_1_1", "field_2"), "Error: fields.")
+
+    def test_15_from_csv_columns(self):
+        """read.from_csv_columns test"""
+
+        filepath = self.fixtures_path.joinpath("wookieepedia_starships").with_suffix(".csv")
+        starships = read.from_csv_to_dicts(filepath)
+        columns = read.from_csv_columns(
+            filepath, dtypes={"crew": "int", "hyperdrive_rating": "float"}, use_numpy=False
+        )
+
+        self.assertEqual(list(columns), list(starships[0]), "Error: column order mismatch.")
+        self.assertIsInstance(columns["crew"], array.array, "Error: crew is not an array.")
+        self.assertEqual(columns["crew"].typecode, "q", "Error: crew typecode is not 'q'.")
+        self.assertEqual(list(columns["crew"]), [int(ship["crew"]) for ship in starships])
+        self.assertTrue(math.isnan(columns["hyperdrive_rating"][6]), "Error: empty is not NaN.")
+        self.assertEqual(columns["name"], [ship["name"] for ship in starships])
+
+        with self.assertRaises(ValueError):
+            read.from_csv_columns(filepath, dtypes={"MGLT": "int"})
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = Path(tmp_dir).joinpath("invalid.csv")
+            for content in ("a,b,a\n1,2,3\n", "a\n1\ninf\n", "a,b\n1,2\n3,4,5\n"):
+                filepath.write_text(content, encoding="utf-8")
+                with self.assertRaises(ValueError):
+                    read.from_csv_columns(filepath, dtypes={"a": "int"})
+
+    def test_16_iter_csv_parallel(self):
+        """read.iter_csv_parallel test"""
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = Path(tmp_dir).joinpath("quoted.csv")
+            with open(filepath, "w", encoding="utf-8", newline="") as file_obj:
+                writer = csv.writer(file_obj)
+                writer.writerow(["id", "quote"])
+                for i in range(500):
+                    writer.writerow([i, f'line {i}\nsaid "hi",\r\nagain' if i % 3 else "plain"])
+            rows = read.from_csv(filepath)
+
+            parallel = read.iter_csv_parallel(filepath, workers=2, chunk_size=512)
+            self.assertIsInstance(parallel, types.GeneratorType, "Error: not a generator.")
+            self.assertEqual(list(parallel), rows, "Error: rows do not match.")
+
+            counts = read.from_csv_parallel(
+                filepath, workers=2, chunk_size=512, skip_header=True, map_fn=len
+            )
+            self.assertGreater(len(counts), 1, "Error: file was not split into chunks.")
+            self.assertEqual(sum(counts), len(rows) - 1, "Error: row counts do not match.")
+
+    def test_17_csv_usecols_where_contains(self):
+        """read.from_csv/from_csv_to_dicts usecols, where and contains test"""
+
+        filepath = self.fixtures_path.joinpath("wookieepedia_planets").with_suffix(".csv")
+        planets = read.from_csv_to_dicts(filepath)
+        expected = [
+            {"name": planet["name"], "climate": planet["climate"]}
+            for planet in planets
+            if "Temperate" in planet["climate"]
+        ]
+
+        rows = read.from_csv(filepath, usecols=["name", "climate"], contains="Temperate")
+        self.assertEqual(rows[0], ["name", "climate"], "Error: header not projected.")
+        self.assertEqual(rows[1:], [list(row.values()) for row in expected])
+
+        for row_type in (None, "slots"):
+            rows = read.from_csv_to_dicts(
+                filepath,
+                row_type=row_type,
+                usecols=["name", "climate"],
+                where=lambda row: "Temperate" in row["climate"],
+                contains="Temperate",
+            )
+            self.assertEqual(
+                [dict(row.items()) for row in rows], expected, f"Error: {row_type} rows."
+            )
+
+        rows = list(read.iter_csv_to_dicts(filepath, contains=("Tatooine", "Naboo")))
+        self.assertEqual([row["name"] for row in rows], ["Naboo", "Tatooine"])
+
+        with self.assertRaises(ValueError):
+            read.from_csv(filepath, usecols=["galaxy"])
+
+    def test_18_from_csv_typed(self):
+        """read.from_csv_typed and read.infer_schema test"""
+
+        filepath = self.fixtures_path.joinpath("wookieepedia_planets").with_suffix(".csv")
+        schema = read.infer_schema(filepath)
+        self.assertEqual(schema["name"], "str", "Error: name not inferred as str.")
+        self.assertEqual(schema["population"], "int", "Error: population not inferred as int.")
+        self.assertEqual(schema["rotation_period"], "float", "Error: period not inferred.")
+
+        planets = read.from_csv_to_dicts(filepath)
+        typed = read.from_csv_typed(filepath)
+        self.assertEqual(len(typed), len(planets), "Error: row counts do not match.")
+        for planet, row in zip(planets, typed):
+            self.assertEqual(row["suns"], convert.to_int(planet["suns"]), "Error: suns value.")
+            self.assertEqual(row["rotation_period"], convert.to_float(planet["rotation_period"]))
+
+        records = read.from_csv_typed(filepath, {"suns": "int"}, row_type="slots")
+        self.assertEqual(records[1].suns, 1, "Error: record value not converted.")
+        self.assertEqual(records[1]["diameter"], "12500", "Error: untyped value converted.")
+
+        with self.assertRaises(ValueError):
+            read.from_csv_typed(filepath, {"galaxy": "int"})
+
+    def test_19_parse_cache(self):
+        """read.ParseCache test"""
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            filepath = tmp_path.joinpath("loc.yml")
+            filepath.write_bytes(self.fixtures_path.joinpath("loc.yml").read_bytes())
+            config = read.from_yaml(filepath)
+
+            cache = read.ParseCache()
+            self.assertEqual(read.from_yaml(filepath, cache=cache), config, "Error: miss value.")
+            snapshots = list(tmp_path.glob(".loc.yml.*.parsecache"))
+            self.assertEqual(len(snapshots), 1, "Error: sidecar snapshot not written.")
+            self.assertEqual(read.from_yaml(filepath, cache=cache), config, "Error: hit value.")
+
+            # A changed source invalidates the snapshot.
+            filepath.write_text("maps: {}\n", encoding="utf-8")
+            self.assertEqual(read.from_yaml(filepath, cache=cache), {"maps": {}})
+            cache.clear(filepath)
+            self.assertFalse(list(tmp_path.glob("*.parsecache")), "Error: snapshot not cleared.")
+
+            # Options are part of the key; the least recently used snapshot is evicted.
+            csv_path = self.fixtures_path.joinpath("wookieepedia_planets").with_suffix(".csv")
+            cache = read.ParseCache(tmp_path.joinpath("cache"))
+            rows = read.from_csv(csv_path, cache=cache)
+            cache.max_bytes = next(cache.directory.glob("*.parsecache")).stat().st_size
+            names = read.from_csv(csv_path, usecols=["name"], cache=cache)
+            self.assertEqual(rows, read.from_csv(csv_path), "Error: cached rows do not match.")
+            self.assertEqual(names, read.from_csv(csv_path, usecols=["name"]))
+            self.assertEqual(read.from_csv(csv_path, usecols=["name"], cache=cache), names)
+            snapshots = list(cache.directory.glob("*.parsecache"))
+            self.assertEqual(len(snapshots), 1, "Error: snapshot not evicted.")
+            self.assertLessEqual(snapshots[0].stat().st_size, cache.max_bytes)
+
+            with self.assertRaises(ValueError):
+                read.from_csv(csv_path, where=bool, cache=cache)
+
+    def test_20_file_memo(self):
+        """read.FileMemo, from_json_cached and from_yaml_cached test"""
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = Path(tmp_dir).joinpath("config.json")
+            filepath.write_text('{"hosts": ["a", "b"]}', encoding="utf-8")
+            memo = read.FileMemo(maxsize=2)
+
+            config = read.from_json_cached(filepath, mode="copy", memo=memo)
+            config["hosts"].append("c")  # copy-on-read guards the cached value
+            self.assertEqual(
+                read.from_json_cached(filepath, mode="copy", memo=memo), {"hosts": ["a", "b"]}
+            )
+
+            frozen = read.from_json_cached(filepath, memo=memo)
+            self.assertIs(read.from_json_cached(filepath, memo=memo), frozen)
+            self.assertEqual(frozen, {"hosts": ("a", "b")}, "Error: frozen value.")
+            with self.assertRaises(TypeError):
+                frozen["hosts"] = []
+
+            filepath.write_text('{"hosts": ["d"]}', encoding="utf-8")
+            self.assertEqual(
+                read.from_json_cached(filepath, mode="copy", memo=memo), {"hosts": ["d"]}
+            )
+            self.assertEqual(memo.cache_info(), read.MemoInfo(2, 2, 1, 2, 2), "Error: stats.")
+
+            yaml_path = self.fixtures_path.joinpath("loc").with_suffix(".yml")
+            self.assertEqual(
+                read.from_yaml_cached(yaml_path, memo=memo),
+                convert.to_frozen(read.from_yaml(yaml_path)),
+            )
+            self.assertEqual(memo.cache_info().currsize, 2, "Error: LRU entry not evicted.")
+
+            memo.cache_clear()
+            calls = []
+
+            def slow_parse(path):
+                calls.append(path)
+                time.sleep(0.05)
+                return read.from_json(path)
+
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(lambda _: memo.load(filepath, slow_parse), range(4)))
+            self.assertEqual(len(calls), 1, "Error: concurrent callers loaded the file twice.")
+            self.assertEqual(results, [{"hosts": ("d",)}] * 4, "Error: shared load results.")
+
+    def test_21_yaml_loaders(self):
+        """read.from_yaml loader and read.iter_yaml_documents test"""
+
+        filepath = self.fixtures_path.joinpath("loc").with_suffix(".yml")
+        config = read.from_yaml(filepath)
+        self.assertEqual(read.from_yaml(filepath, loader="safe"), config, "Error: safe loader.")
+        with self.assertRaises(ValueError):
+            read.from_yaml(filepath, loader="unsafe")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = Path(tmp_dir).joinpath("manifest.yml")
+            filepath.write_text("name: a\n---\nname: b\n---\n- 1\n- 2\n", encoding="utf-8")
+            documents = read.iter_yaml_documents(filepath, loader="safe")
+            self.assertIsInstance(documents, types.GeneratorType, "Error: not a generator.")
+            self.assertEqual(next(documents), {"name": "a"}, "Error: first document.")
+            self.assertEqual(list(documents), [{"name": "b"}, [1, 2]], "Error: documents.")
+
+    def test_22_iter_jsonl(self):
+        """read.iter_jsonl and read.from_jsonl test"""
+
+        filepath = self.fixtures_path.joinpath("wookieepedia_people").with_suffix(".json")
+        people = read.from_json(filepath)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = Path(tmp_dir).joinpath("people.jsonl")
+            with open(filepath, "w", encoding="utf-8") as file_obj:
+                for person in people:
+                    file_obj.write(f"{json.dumps(person)}\n\n")
+
+            records = read.iter_jsonl(filepath)
+            self.assertIsInstance(records, types.GeneratorType, "Error: not a generator.")
+            self.assertEqual(list(records), people, "Error: records do not match.")
+            self.assertEqual(
+                read.from_jsonl(filepath, workers=2, chunk_size=256),
+                people,
+                "Error: records decoded in parallel do not match.",
+            )
+
+            with open(filepath, "a", encoding="utf-8") as file_obj:
+                file_obj.write("{broken\n")
+            with self.assertRaisesRegex(json.JSONDecodeError, f"line {2 * len(people) + 1}"):
+                read.from_jsonl(filepath)
+
+    def test_23_iter_json_array(self):
+        """read.iter_json_array test"""
+
+        filepath = self.fixtures_path.joinpath("wookieepedia_people").with_suffix(".json")
+        people = read.from_json(filepath)
+        records = read.iter_json_array(filepath, chunk_size=100)
+        self.assertIsInstance(records, types.GeneratorType, "Error: not a generator.")
+        self.assertEqual(list(records), people, "Error: elements do not match.")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = Path(tmp_dir).joinpath("page.json")
+            page = {"count": len(people), "meta": {"next": None}, "results": people}
+            filepath.write_text(json.dumps(page, indent=2), encoding="utf-8")
+            names = [
+                person["name"]
+                for person in read.iter_json_array(filepath, "results.item", chunk_size=64)
+            ]
+            self.assertEqual(names, [person["name"] for person in people], "Error: names.")
+
+            filepath.write_text('[{"name": "Luke"}, {"name": ', encoding="utf-8")
+            with self.assertRaises(json.JSONDecodeError):
+                list(read.iter_json_array(filepath))
+
+            filepath = Path(tmp_dir).joinpath("numbers.json")
+            numbers = [-2500.0, 1.5, 1e3, -12, 0, 3.25e-7, 123456789, -0.0, 6.02e23, 42, 7.0]
+            filepath.write_text(json.dumps(numbers), encoding="utf-8")
+            with filepath.open("r", encoding="utf-8") as file_obj:
+                expected = json.load(file_obj)
+            for chunk_size in range(1, 9):
+                self.assertEqual(
+                    list(read.iter_json_array(filepath, chunk_size=chunk_size)),
+                    expected,
+                    f"Error: numbers do not match json.load at chunk_size={chunk_size}.",
+                )
+
+    def test_24_line_index(self):
+        """read.LineIndex test"""
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = Path(tmp_dir).joinpath("speech.txt")
+            source = self.fixtures_path.joinpath("mandela-rivonia_trial-verbatim")
+            filepath.write_bytes(source.with_suffix(".txt").read_bytes().rstrip() + b"\nno newline")
+            speech = read.from_txt(filepath)
+
+            with read.LineIndex(filepath) as lines:
+                self.assertEqual(len(lines), len(speech), "Error: line count.")
+                self.assertEqual(lines[2], "Transcript", "Error: lines[2] != 'Transcript'.")
+                self.assertEqual(lines[-1], "no newline", "Error: last line.")
+                self.assertEqual(lines[10:20:3], speech[10:20:3], "Error: slice mismatch.")
+                self.assertEqual(list(lines), speech, "Error: lines do not match.")
+                with self.assertRaises(IndexError):
+                    lines[len(speech)]
+            self.assertTrue(
+                Path(tmp_dir).joinpath(".speech.txt.lineindex").exists(), "Error: no sidecar."
+            )
+            with read.LineIndex(filepath, strip=False) as lines:
+                self.assertEqual(lines[:], read.from_txt(filepath, strip=False))
+
+            # A changed file invalidates the sidecar index.
+            filepath.write_text("first\nsecond\n", encoding="utf-8")
+            with read.LineIndex(filepath) as lines:
+                self.assertEqual(lines[:], ["first", "second"], "Error: stale index used.")
+
+        filepath = self.fixtures_path.joinpath("wookieepedia_starships").with_suffix(".csv")
+        starships = read.from_csv(filepath)
+        with read.LineIndex(filepath, persist=False) as rows:
+            self.assertEqual(rows.row(0), starships[0], "Error: header row.")
+            self.assertEqual(rows.row(-1), starships[-1], "Error: last row.")
+            self.assertEqual(rows.rows(2, 5), starships[2:5], "Error: row slice.")
+
+    def test_25_head_tail(self):
+        """read.head_txt, tail_txt, head_csv and tail_csv test"""
+
+        filepath = self.fixtures_path.joinpath("mandela-rivonia_trial-verbatim").with_suffix(".txt")
+        speech = read.from_txt(filepath)
+        self.assertEqual(read.head_txt(filepath, 3), speech[:3], "Error: head lines.")
+        for n in (1, 5, len(speech), len(speech) + 5):
+            self.assertEqual(
+                read.tail_txt(filepath, n, block_size=16), speech[-n:], f"Error: tail {n} lines."
+            )
+        self.assertEqual(read.tail_txt(filepath, 0), [], "Error: tail 0 lines.")
+        self.assertEqual(
+            read.tail_txt(filepath, 4, strip=False), read.from_txt(filepath, strip=False)[-4:]
+        )
+
+        filepath = self.fixtures_path.joinpath("wookieepedia_planets").with_suffix(".csv")
+        planets = read.from_csv(filepath)
+        self.assertEqual(read.head_csv(filepath, 2), planets[:3], "Error: head rows.")
+        self.assertEqual(read.tail_csv(filepath, 2), planets[:1] + planets[-2:], "Error: tail.")
+        self.assertEqual(read.tail_csv(filepath, 100), planets, "Error: tail beyond start.")
+
+    def test_26_incremental_reader(self):
+        """read.IncrementalReader and read.follow test"""
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            filepath = tmp_path.joinpath("ships.csv")
+            checkpoint = tmp_path.joinpath("ships.checkpoint.json")
+            filepath.write_text('name,note\nX-wing,"fast\n', encoding="utf-8")
+
+            reader = read.IncrementalReader(filepath, "csv", as_dicts=True, checkpoint=checkpoint)
+            self.assertEqual(reader.read(), [], "Error: open quoted field returned.")
+            self.assertEqual(reader.header, ["name", "note"], "Error: header not kept.")
+            with open(filepath, "a", encoding="utf-8") as file_obj:
+                file_obj.write('agile"\nY-wing,sturdy\nB-wi')
+            self.assertEqual(
+                reader.read(),
+                [{"name": "X-wing", "note": "fast\nagile"}, {"name": "Y-wing", "note": "sturdy"}],
+                "Error: unexpected complete records.",
+            )
+            reader.close()
+
+            # A new reader resumes from the checkpoint.
+            with open(filepath, "a", encoding="utf-8") as file_obj:
+                file_obj.write("ng,heavy\n")
+            with read.IncrementalReader(filepath, "csv", checkpoint=checkpoint) as reader:
+                self.assertEqual(reader.read(), [["B-wing", "heavy"]], "Error: not resumed.")
+
+            # Rotation: unread lines in the old file are read before the new file.
+            filepath = tmp_path.joinpath("app.log")
+            filepath.write_text("one\n", encoding="utf-8")
+            with read.IncrementalReader(filepath) as reader:
+                self.assertEqual(reader.read(), ["one"], "Error: first line.")
+                with open(filepath, "a", encoding="utf-8") as file_obj:
+                    file_obj.write("two")
+                filepath.rename(tmp_path.joinpath("app.log.1"))
+                filepath.write_text("three\n", encoding="utf-8")
+                self.assertEqual(reader.read(), ["two", "three"], "Error: rotation.")
+
+                filepath.write_text("four\n", encoding="utf-8")  # truncated in place
+                self.assertEqual(reader.read(), ["four"], "Error: truncation.")
+
+            filepath = tmp_path.joinpath("events.jsonl")
+            filepath.write_text('{"id": 1}\n{"id": 2}\n{"id":', encoding="utf-8")
+            events = list(read.follow(filepath, "jsonl", interval=0.01, timeout=0.05))
+            self.assertEqual(events, [{"id": 1}, {"id": 2}], "Error: followed records.")
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -1,8 +1,13 @@
+import hashlib
+import json
+import os
 import sys
+import tempfile
 import unittest
 
 from pathlib import Path
-from src.umpyutl import read, write
+from src.umpyutl import http, read, write
+from tests.server import StandInServer, serve_bytes
 
 # project_path = Path.cwd().parent
 # if project_path not in sys.path:
@@ -14,6 +19,17 @@ PARENT_PATH = Path(__file__).parent.resolve()
 class UmpyUtlWriteTest(unittest.TestCase):
     """umpyutl functional tests."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Start local stand-in server."""
+        cls.server = StandInServer()
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Stop local stand-in server."""
+        cls.server.stop()
+
     def setUp(self):
         """Default values."""
         self.fixtures_path = PARENT_PATH.joinpath("fixtures")
@@ -408,6 +424,119 @@ class UmpyUtlWriteTest(unittest.TestCase):
             "Error: file contents do not match fixture value",
         )
 
+    def test_09_download_ranges_resume(self):
+        """write.download parallel ranges with resume test"""
+
+        fxt_data = os.urandom(256 * 1024 + 7)
+        ranged = serve_bytes(fxt_data)
+        outage = {"active": True}
+
+        def flaky(request):
+            if outage["active"] and not request.headers.get("Range", "").startswith(
+                ("bytes=0-", "bytes=65538-")
+            ):
+                return 503, {}, {"detail": "Service Unavailable"}
+            return ranged(request)
+
+        self.server.route("/files/flaky.bin", flaky)
+        url = self.server.url("/files/flaky.bin")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = Path(tmp_dir).joinpath("flaky.bin")
+            with http.Client() as client:
+                with self.assertRaises(Exception):
+                    write.download(url, filepath, parts=4, chunk_size=4096, client=client)
+                journal = Path(f"{filepath}.download.json")
+                self.assertTrue(journal.exists(), "Error: progress journal not kept.")
+
+                # Ranges 0 and 1 may have been stopped mid-stream when the others failed;
+                # each unfinished range must resume from its journaled offset.
+                with open(journal, "r", encoding="utf-8") as file_obj:
+                    expected = [
+                        f"bytes={start}-{end - 1}"
+                        for start, end in json.load(file_obj)["ranges"]
+                        if start < end
+                    ]
+                self.assertGreaterEqual(len(expected), 2, "Error: failed ranges not journaled.")
+
+                outage["active"] = False
+                count = len(self.server.requests)
+                write.download(url, filepath, parts=4, chunk_size=4096, client=client)
+                ranges = [
+                    request["headers"].get("Range")
+                    for request in self.server.requests[count:]
+                    if request["path"] == "/files/flaky.bin"
+                ]
+
+            self.assertEqual(filepath.read_bytes(), fxt_data, "Error: file does not match.")
+            self.assertFalse(journal.exists(), "Error: journal not removed.")
+            self.assertEqual(ranges[0], "bytes=0-0", "Error: expected a range probe.")
+            self.assertEqual(sorted(ranges[1:]), sorted(expected), "Error: ranges not resumed.")
+
+    def test_10_download_fallback(self):
+        """write.download without range support test"""
+
+        fxt_data = os.urandom(100 * 1024)
+        self.server.route("/files/plain.bin", serve_bytes(fxt_data, ranges=False))
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = Path(tmp_dir).joinpath("plain.bin")
+            write.download(self.server.url("/files/plain.bin"), filepath, parts=4)
+
+            self.assertEqual(filepath.read_bytes(), fxt_data, "Error: file does not match.")
+        self.assertEqual(self.server.hits("/files/plain.bin"), 1, "Error: body fetched twice.")
+
+    def test_11_to_file_response_chunked(self):
+        """write.to_file_response_chunked digest and progress test"""
+
+        fxt_data = os.urandom(3 * 1024 * 1024 + 11)
+        self.server.route("/files/holocron.bin", serve_bytes(fxt_data, ranges=False))
+        calls = []
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = Path(tmp_dir).joinpath("holocron.bin")
+            with http.Client() as client:
+                response = client.get(self.server.url("/files/holocron.bin"), stream=True)
+                sha256 = write.to_file_response_chunked(
+                    filepath,
+                    response,
+                    mode="w",  # text mode is written as binary
+                    digest="sha256",
+                    progress=lambda written, total, rate: calls.append((written, total)),
+                )
+                # Response already consumed (not streamed)
+                response = client.get(self.server.url("/files/holocron.bin"))
+                md5 = write.to_file_response_chunked(filepath, response, digest="md5")
+
+            self.assertEqual(filepath.read_bytes(), fxt_data, "Error: file does not match.")
+
+        self.assertEqual(sha256, hashlib.sha256(fxt_data).hexdigest(), "Error: sha256 mismatch.")
+        self.assertEqual(md5, hashlib.md5(fxt_data).hexdigest(), "Error: md5 mismatch.")
+        self.assertEqual(calls[-1], (len(fxt_data), len(fxt_data)), "Error: progress mismatch.")
+        self.assertLess(len(calls), len(fxt_data) // (64 * 1024), "Error: chunk size not grown.")
+
+    def test_12_to_jsonl(self):
+        """write.to_jsonl and write.append_jsonl test"""
+
+        fxt_people = read.from_json(
+            self.fixtures_path.joinpath("wookieepedia_people").with_suffix(".json")
+        )
+
+        filepath = self.output_path.joinpath("people").with_suffix(".jsonl")
+        count = write.to_jsonl(filepath, (person for person in fxt_people[:3]), batch_size=2)
+        self.assertEqual(count, 3, "Error: unexpected record count.")
+
+        # Simulate an interrupted write, then append the remaining records.
+        with open(filepath, "a", encoding="utf-8") as file_obj:
+            file_obj.write('{"name": "partial"}')
+        count = write.append_jsonl(filepath, fxt_people[3:])
+        self.assertEqual(count, len(fxt_people) - 3, "Error: unexpected appended count.")
+
+        people = list(read.iter_jsonl(filepath))
+        self.assertEqual(people[:3], fxt_people[:3], "Error: written records do not match.")
+        self.assertEqual(people[3], {"name": "partial"}, "Error: partial line not terminated.")
+        self.assertEqual(people[4:], fxt_people[3:], "Error: appended records do not match.")
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)